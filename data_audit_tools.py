@@ -1,14 +1,51 @@
 import pandas as pd
+import numpy as np
 from google import genai
+from google.genai import errors as genai_errors
+import httpx
 import os
 import logging
-from typing import Tuple, List, Dict, Any
+import functools
+import threading
+import time
+import random
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import OrderedDict, deque
+from typing import Tuple, List, Dict, Any, Optional
 import json
-from datetime import datetime
+import re
+import bisect
+import textwrap
+import hashlib
+import shelve
+import tempfile
+from datetime import datetime, timedelta
 import dotenv
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+try:
+    import pyarrow  # noqa: F401 - optional, enables pandas' multithreaded CSV parser
+    CSV_ENGINE = 'pyarrow'
+    STRING_STORAGE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+    STRING_STORAGE = 'python'
 
 dotenv.load_dotenv()
 
+# Version of the prompt wording, part of every cache key. Bump it when prompts change so
+# responses to the old wording are no longer served.
+PROMPT_VERSION = "v1"
+
+# Outermost JSON array in a model response (greedy, so nested arrays stay inside the match)
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+# Outermost JSON object in a model response, likewise greedy
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+# JSON array inside a markdown code fence; preferred over the greedy span when present,
+# since search-grounded answers may put bracketed citations like "[1]" around the fence
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\[.*?\])\s*```', re.DOTALL)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,34 +57,466 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Marks a lazily resolved attribute whose legitimate value may be None
+_UNRESOLVED = object()
+
+# Fields kept from each tool record in a parsed response, with the value used when the
+# model leaves one out (callables build a fresh default per record)
+_SUGGESTION_FIELDS = (
+    ('tool_name', 'Unknown'), ('row_index', 0), ('missing_requirements', list), ('suggestions', list)
+)
+_CONTRADICTION_FIELDS = (
+    ('tool_name', 'Unknown'), ('row_index', 0),
+    ('current_reading_category', 'nan'), ('current_cognitive_category', 'nan'),
+    ('current_executive_function_category', 'nan'), ('current_vision_category', 'nan'),
+    ('current_physical_category', 'nan'), ('current_hearing_category', 'nan'),
+    ('current_speech_category', 'nan'), ('current_training_category', 'nan'),
+    ('contradictions', list)
+)
+
+def _validate_tool_records(parsed: List[Any], fields: Tuple[Tuple[str, Any], ...]) -> List[Dict[str, Any]]:
+    """
+    Keep the records of a parsed response that name a tool, reduced to the given fields
+    
+    Pure function of the parsed data, run by the worker thread that received the
+    response so validation overlaps with the requests still in flight.
+    """
+    validated = []
+    for record in parsed:
+        if isinstance(record, dict) and 'tool_name' in record:
+            validated.append({
+                field: record[field] if field in record else (default() if callable(default) else default)
+                for field, default in fields
+            })
+    return validated
+
+def _salvage_json_array(text: str) -> List[Any]:
+    """
+    Complete elements at the front of a truncated or partly malformed JSON array
+    
+    A streamed response cut off mid-record (token limit, dropped connection) still
+    carries every record before the cut, so decode them one at a time and stop at
+    the first element that does not parse. Returns an empty list when none do.
+    """
+    start = text.find('[')
+    if start == -1:
+        return []
+    decoder = json.JSONDecoder()
+    items = []
+    pos = start + 1
+    while True:
+        while pos < len(text) and text[pos] in ' \t\r\n,':
+            pos += 1
+        if pos >= len(text) or text[pos] == ']':
+            break
+        try:
+            item, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            break
+        items.append(item)
+    return items
+
+@functools.lru_cache(maxsize=None)
+def _client(api_key: str) -> genai.Client:
+    """Shared Gemini client per API key, so every DataAuditTools instance reuses its connections"""
+    return genai.Client(api_key=api_key)
+
+class RateLimiter:
+    """
+    Token bucket that spaces Gemini requests out so that concurrent batches
+    stay under the provider's per-minute request quota
+    """
+    
+    def __init__(self, requests_per_minute: int):
+        self.interval = 60.0 / requests_per_minute
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+    
+    def acquire(self):
+        """Block until the next request slot is available"""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling Gemini while the circuit breaker is open"""
+
+class CircuitBreaker:
+    """
+    Stops calling Gemini for a cool-down period after several consecutive requests
+    fail on server or rate-limit errors, so an outage fails the remaining batches
+    fast instead of each one sitting through its own retries
+    """
+    
+    def __init__(self, failure_threshold: int = 5, cooldown_seconds: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._open_until = 0.0
+    
+    def check(self):
+        """Raise CircuitOpenError while the breaker is open"""
+        with self._lock:
+            remaining = self._open_until - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(f"Gemini calls paused after repeated failures, resuming in {remaining:.0f}s")
+    
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+    
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures < self.failure_threshold:
+                return
+            self._failures = 0
+            self._open_until = time.monotonic() + self.cooldown_seconds
+        logger.warning(f"{self.failure_threshold} Gemini requests failed in a row, pausing calls for {self.cooldown_seconds:.0f}s")
+
+class GeminiCache:
+    """
+    On-disk cache of Gemini responses keyed by a hash of the prompt version, model, prompt and config
+    
+    Re-running an audit on unchanged rows produces identical prompts, so a hit
+    returns the stored response text without calling the API at all. Entries
+    expire after ttl_days so web-grounded answers are refreshed periodically.
+    """
+    
+    def __init__(self, cache_dir: str, ttl_days: float = 7):
+        self.cache_dir = cache_dir
+        self.ttl = timedelta(days=ttl_days)
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    @staticmethod
+    def make_key(model: str, prompt: str, config: Dict[str, Any] = None) -> str:
+        """Build the cache key for a request"""
+        config_text = json.dumps(config, sort_keys=True, default=str) if config else ''
+        return hashlib.sha256(f"{PROMPT_VERSION}\n{model}\n{config_text}\n{prompt}".encode('utf-8')).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str):
+        """Return the cached response text, or None on a miss or an expired entry"""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if 'expires_at' in entry and datetime.fromisoformat(entry['expires_at']) <= datetime.now():
+                return None
+            return entry['response_text']
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    def set(self, key: str, response_text: str):
+        """Store response text, writing atomically so concurrent batches never see partial files"""
+        now = datetime.now()
+        entry = {
+            'response_text': response_text,
+            'prompt_version': PROMPT_VERSION,
+            'created_at': now.isoformat(),
+            'expires_at': (now + self.ttl).isoformat()
+        }
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.cache_dir, suffix='.tmp', delete=False) as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(f.name, self._path(key))
+    
+    def invalidate(self, version: str = None) -> int:
+        """
+        Delete cached responses
+        
+        Args:
+            version: Only delete entries stored under this prompt version. If None, delete all
+            
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            if version is not None:
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        if json.load(f).get('prompt_version') != version:
+                            continue
+                except (OSError, ValueError):
+                    continue
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+class CategoryContradiction(BaseModel):
+    """A single category problem reported for a tool"""
+    type: str
+    category_involved: str
+    description: str
+    recommendation: str
+
+class ToolContradictions(BaseModel):
+    """Response schema for one tool in the category contradiction check"""
+    tool_name: str
+    row_index: int
+    current_reading_category: str
+    current_cognitive_category: str
+    current_executive_function_category: str
+    current_vision_category: str
+    current_physical_category: str
+    current_hearing_category: str
+    current_speech_category: str
+    current_training_category: str
+    contradictions: List[CategoryContradiction]
+
+# Structured output config for the contradiction check. Gemini rejects a response
+# schema combined with the google_search tool, so grounded calls keep free-text JSON.
+CONTRADICTIONS_RESPONSE_CONFIG = {
+    'response_mime_type': 'application/json',
+    'response_schema': list[ToolContradictions],
+}
+# Parses and validates a schema-conforming response in a single pydantic-core pass
+_CONTRADICTIONS_ADAPTER = TypeAdapter(list[ToolContradictions])
+
+class ToolRemoval(BaseModel):
+    """A tool the combined batch analysis says must be removed"""
+    tool_name: str
+    reason: str
+
+class ContradictionsAndRemovals(BaseModel):
+    """Response schema for the combined contradiction and removal check of one batch"""
+    contradictions: List[ToolContradictions]
+    removals: List[ToolRemoval]
+
+CONTRADICTIONS_AND_REMOVALS_RESPONSE_CONFIG = {
+    'response_mime_type': 'application/json',
+    'response_schema': ContradictionsAndRemovals,
+}
+
 class DataAuditTools:
     """
     A comprehensive data auditing tool using Gemini 2.0 Flash to analyze
     accessibility tools data from active_tools.csv and removed_tools.csv
     """
     
-    def __init__(self, api_key: str = None):
+    # Accessibility category columns, in the order the prompts list them
+    _CATEGORY_COLUMNS = ['Reading', 'Cognitive', 'Executive Function', 'Vision', 'Physical', 'Hearing', 'Speech/ Communication', 'Training/ Therapy']
+    # The 8 essential requirements for a complete tool entry and the columns that can satisfy each
+    _ESSENTIAL_REQUIREMENTS = {
+        'built_in_or_at': ['Built-in', 'AT (Installed)'],  # Must have 'B' or 'I'
+        'pricing': ['FREE', 'Free Trial', 'Lifetime License', 'Subscription'],  # Must have at least one
+        'accessibility_categories': _CATEGORY_COLUMNS,  # Must have at least one
+        'os_compatibility': ['Windows', 'Macintosh', 'Chromebook', 'iPad (iPadOS)', 'iPhone (iOS)', 'Android'],  # Must have at least one
+        'id_tag': ['ID TAG'],  # Must have value
+        'product_name': ['PRODUCT/FEATURE\nNAME'],  # Must have value
+        'description': ['DESCRIPTION'],  # Must have value
+        'vendor_website': ["LINK TO DESCRIPTION ON VENDOR'S WEBSITE"]  # Must have value
+    }
+    # Columns holding a handful of short codes ('B', 'I', 'X', 'R', ...), stored as pandas categoricals
+    _SHORT_CODE_COLUMNS = [*_ESSENTIAL_REQUIREMENTS['built_in_or_at'], *_ESSENTIAL_REQUIREMENTS['pricing'],
+                           *_CATEGORY_COLUMNS, *_ESSENTIAL_REQUIREMENTS['os_compatibility']]
+    # Columns each batch prompt actually refers to (the product name column is always added);
+    # sending only these keeps prompts small on wide sheets
+    _VERIFICATION_PROMPT_COLUMNS = ['PRODUCT/FEATURE\nNAME', 'ID TAG', 'COMPANY', 'DESCRIPTION', "LINK TO DESCRIPTION ON VENDOR'S WEBSITE",
+                                    *_ESSENTIAL_REQUIREMENTS['pricing'], *_ESSENTIAL_REQUIREMENTS['os_compatibility']]
+    _REMOVAL_PROMPT_COLUMNS = ['PRODUCT/FEATURE\nNAME', 'ID TAG', 'COMPANY', 'DESCRIPTION', "LINK TO DESCRIPTION ON VENDOR'S WEBSITE",
+                               'Built-in', 'AT (Installed)', 'AUDITOR NOTES']
+    # Keyword matchers for the removal checks, compiled once; substring matches, so 'remove'
+    # also catches 'removed'
+    _REMOVAL_KEYWORDS_RE = re.compile(
+        '|'.join(map(re.escape, ['remove', 'delete', 'duplicate', 'outdated', 'discontinued', 'no longer available'])),
+        re.IGNORECASE
+    )
+    _ACTIVE_KEYWORDS_RE = re.compile(
+        '|'.join(map(re.escape, ['active', 'current', 'available', 'supported', 'working', 'functional'])),
+        re.IGNORECASE
+    )
+    # Tool ID column names in order of preference
+    _ID_COLUMN_CANDIDATES = ('ID', 'ID_TAG', 'TOOL_ID', 'id', 'id_tag', 'tool_id')
+    # Placeholder strings that mean "no value", compared against stripped, lower-cased cell text
+    _NA_SET = frozenset({'', 'nan', 'none', 'null', 'n/a'})
+    # Shortest tool name from a response that may match a batch tool by substring
+    _MIN_PARTIAL_NAME_LENGTH = 4
+    
+    # Static instructions of the batch prompts; only the batch header and tool records
+    # are formatted per call and appended after them
+    _MISSING_VALUES_PROMPT_HEAD = textwrap.dedent("""\
+        I need you to help fix missing data for these accessibility tools by searching the web for current information.
+
+        For each tool with missing data, please search the web and provide specific suggestions for:
+
+        1. **Built-in or AT Installed**: Should it be marked as Built-in (B) or AT Installed (I)?
+        2. **Pricing**: Is it free, free trial, lifetime license, or subscription?
+        3. **Accessibility Categories**: Which categories should it be marked for (Reading, Cognitive, Vision, Physical, Hearing, Speech, Training)?
+        4. **OS Compatibility**: Which operating systems does it support (Windows, Mac, iPad, iPhone, Android, ChromeOS)?
+        5. **ID TAG**: What should the unique identifier be?
+        6. **Product Name**: Is the current name correct and complete?
+        7. **Description**: What should the description be based on current information?
+        8. **Vendor Website**: What is the correct vendor website URL?
+
+        IMPORTANT: Provide your suggestions in this EXACT JSON format for each tool:
+        {
+            "tool_name": "Exact tool name from data",
+            "row_index": row_number,
+            "missing_requirements": ["list", "of", "missing", "requirements"],
+            "suggestions": [
+                {
+                    "requirement": "requirement_name",
+                    "current_value": "what is currently there",
+                    "suggested_value": "what should be there",
+                    "source": "web search source",
+                    "confidence": "high/medium/low",
+                    "notes": "additional notes or warnings"
+                }
+            ]
+        }
+
+        Return ONLY the JSON array, no other text.
+        """)
+    _CONTRADICTIONS_TASK = textwrap.dedent("""\
+        Analyze these accessibility tools for contradictions between their descriptions and ALL accessibility category assignments.
+
+        The accessibility categories in this database are:
+        - Reading (R)
+        - Cognitive (C) 
+        - Executive Function (E)
+        - Vision (V)
+        - Physical (P)
+        - Hearing (H)
+        - Speech/Communication (S)
+        - Training/Therapy (T)
+
+        For each tool, analyze ALL categories:
+        1. Does the description clearly indicate it's for reading accessibility (dyslexia, reading difficulties, text-to-speech)?
+        2. Does the description clearly indicate it's for cognitive accessibility (ADHD, learning disabilities, memory support)?
+        3. Does the description clearly indicate it's for executive function support (planning, organization, time management)?
+        4. Does the description clearly indicate it's for vision accessibility (blind, low vision, visual impairments)?
+        5. Does the description clearly indicate it's for physical accessibility (mobility, motor control, switch access)?
+        6. Does the description clearly indicate it's for hearing accessibility (deaf, hard of hearing, audio impairments)?
+        7. Does the description clearly indicate it's for speech/communication accessibility (non-verbal, speech difficulties, AAC)?
+        8. Does the description clearly indicate it's for training/therapy (rehabilitation, skill development, therapeutic exercises)?
+
+        Identify any tools where:
+        - Description mentions accessibility for one category but is marked in a different category
+        - Description clearly indicates accessibility for a category but that category is missing
+        - Category assignments seem incorrect based on the description
+        - Tools are missing categories they should have based on their description
+
+        IMPORTANT: Provide your analysis in this EXACT JSON format for each tool:
+        {
+            "tool_name": "Exact tool name from data",
+            "row_index": row_number,
+            "current_reading_category": "R" or "nan",
+            "current_cognitive_category": "C" or "nan", 
+            "current_executive_function_category": "E" or "nan",
+            "current_vision_category": "V" or "nan",
+            "current_physical_category": "P" or "nan",
+            "current_hearing_category": "H" or "nan",
+            "current_speech_category": "S" or "nan",
+            "current_training_category": "T" or "nan",
+            "contradictions": [
+                {
+                    "type": "missing_category" or "incorrect_category_assignment" or "category_mismatch" or "overcategorization",
+                    "category_involved": "Reading" or "Cognitive" or "Executive Function" or "Vision" or "Physical" or "Hearing" or "Speech/Communication" or "Training/Therapy",
+                    "description": "Detailed description of the contradiction",
+                    "recommendation": "Specific recommendation for correction"
+                }
+            ]
+        }
+
+        If a tool has NO contradictions, still include it with an empty contradictions array:
+        {
+            "tool_name": "Tool Name",
+            "row_index": row_number,
+            "current_reading_category": "R" or "nan",
+            "current_cognitive_category": "C" or "nan",
+            "current_executive_function_category": "E" or "nan", 
+            "current_vision_category": "V" or "nan",
+            "current_physical_category": "P" or "nan",
+            "current_hearing_category": "H" or "nan",
+            "current_speech_category": "S" or "nan",
+            "current_training_category": "T" or "nan",
+            "contradictions": []
+        }
+
+        """)
+    _CONTRADICTIONS_PROMPT_HEAD = _CONTRADICTIONS_TASK + "Return ONLY the JSON array, no other text.\n"
+    # complete_audit asks for contradictions and removals in one request per batch; the
+    # contradiction instructions come first so every batch prompt shares the same prefix
+    _CONTRADICTIONS_AND_REMOVALS_PROMPT_HEAD = _CONTRADICTIONS_TASK + textwrap.dedent("""\
+        In the same pass, identify ONLY the tools that must be removed (outdated or discontinued
+        tools, duplicate entries, tools that don't meet accessibility criteria, tools with poor
+        data quality), using the details given for each tool. Give the exact tool name and the reason.
+
+        Return ONLY a JSON object with two keys, no other text:
+        {
+            "contradictions": [one entry per tool in the format above],
+            "removals": [{"tool_name": "Exact tool name from data", "reason": "Why it must be removed"}]
+        }
+        """)
+    # Upper bound on the estimated tokens of the tool data sent in one batch prompt
+    MAX_BATCH_PAYLOAD_TOKENS = 32000
+    # Number of recent requests whose responses are shared with identical concurrent or repeated requests
+    INFLIGHT_LIMIT = 128
+    # Gemini status codes worth retrying: rate limiting and transient server errors
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    # Transport failures retried like transient server errors: timeouts, connection resets
+    # and streams dropped mid-response
+    RETRYABLE_TRANSPORT_ERRORS = (httpx.TransportError, TimeoutError, ConnectionError)
+    
+    def __init__(self, api_key: str = None, max_workers: int = 8, requests_per_minute: int = 60,
+                 cache_dir: str = '.gemini_cache', cache_ttl_days: float = 7):
         """
         Initialize the DataAuditTools with Gemini API
         
         Args:
             api_key (str): Google Gemini API key. If None, will try to get from environment
+            max_workers (int): Maximum number of Gemini batch requests in flight at once
+            requests_per_minute (int): Gemini request quota shared by all concurrent batches
+            cache_dir (str): Directory for cached Gemini responses. If None, caching is disabled
+            cache_ttl_days (float): Days before a cached response is requested again
         """
         self.api_key = api_key or os.getenv('GOOGLE_GEMINI_API_KEY')
         if not self.api_key:
             raise ValueError("Google Gemini API key is required. Set GOOGLE_GEMINI_API_KEY environment variable or pass api_key parameter.")
         
-        self.model = genai.Client(api_key=self.api_key)
+        self.model = _client(self.api_key)
+        self.max_workers = max_workers
+        self._rate_limiter = RateLimiter(requests_per_minute)
+        self._circuit_breaker = CircuitBreaker()
+        self.cache = GeminiCache(cache_dir, ttl_days=cache_ttl_days) if cache_dir else None
+        self._inflight = OrderedDict()
+        self._inflight_lock = threading.Lock()
         
         # Load data
         self.active_tools = None
         self.removed_tools = None
         self.load_data()
+        self._product_name_col = self._resolve_product_name_column()
         
         # Initialize successfully
     
     def get_product_name_column(self) -> str:
-        """Get the correct product name column from the loaded data"""
+        """Get the correct product name column, resolved once per load_data()"""
+        if self._product_name_col is None:
+            self._product_name_col = self._resolve_product_name_column()
+        return self._product_name_col
+    
+    def get_id_column(self) -> Optional[str]:
+        """Get the tool ID column, or None when the sheet has none, resolved once per load_data()"""
+        if self._id_col is _UNRESOLVED:
+            columns = self.active_tools.columns if self.active_tools is not None else ()
+            self._id_col = next((col for col in self._ID_COLUMN_CANDIDATES if col in columns), None)
+        return self._id_col
+    
+    def _resolve_product_name_column(self) -> str:
+        """Detect the product name column from the loaded data"""
         if self.active_tools is not None:
             # Available columns are logged at debug level only if needed
             
@@ -58,13 +527,13 @@ class DataAuditTools:
                                                 # Found exact product name column
                     return col
             
-            # Look for columns that contain 'name' or 'product' but exclude 'Unnamed' columns
+            # Look for columns that contain 'name' or 'product' ('Unnamed' columns are dropped at load time)
             for col in self.active_tools.columns:
-                if ('name' in col.lower() or 'product' in col.lower()) and 'unnamed' not in col.lower():
+                if 'name' in col.lower() or 'product' in col.lower():
                     # Check if this column has mostly string data
                     try:
                         sample_data = self.active_tools[col].dropna().head(10)
-                        if len(sample_data) > 0 and sample_data.dtype == 'object':
+                        if len(sample_data) > 0 and pd.api.types.is_string_dtype(sample_data.dtype):
                             # Found valid name-like column
                             return col
                     except Exception as e:
@@ -74,7 +543,7 @@ class DataAuditTools:
             # If still no good column found, look for the first column with string data
             for col in self.active_tools.columns:
                 try:
-                    if self.active_tools[col].dtype == 'object':
+                    if pd.api.types.is_string_dtype(self.active_tools[col].dtype):
                         # Using first string column as fallback
                         return col
                 except Exception as e:
@@ -86,17 +555,48 @@ class DataAuditTools:
             return self.active_tools.columns[0]
         return 'PRODUCT/FEATURE NAME'  # Default fallback
     
+    @classmethod
+    def _read_tool_csv(cls, path: str) -> pd.DataFrame:
+        """
+        Read a tools CSV, skipping the empty 'Unnamed: N' spreadsheet columns at parse time
+        so they never take memory or reach a prompt
+        """
+        header = pd.read_csv(path, nrows=0).columns
+        keep = [col for col in header if not col.lower().startswith('unnamed')]
+        df = pd.read_csv(path, engine=CSV_ENGINE, usecols=keep)
+        
+        # Text columns use pandas' string dtype (pyarrow-backed when available, NaN for empty
+        # cells) rather than object columns of Python str; pandas 3 already reads them this way
+        text_dtype = pd.StringDtype(STRING_STORAGE, na_value=np.nan)
+        for col in df.select_dtypes(include='object').columns:
+            if pd.api.types.infer_dtype(df[col], skipna=True) == 'string':
+                df[col] = df[col].astype(text_dtype)
+        
+        # Store whole-number columns in the smallest integer type that fits
+        for col in df.select_dtypes(include='integer').columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        
+        # Short-code columns become categoricals: one small integer code per cell instead of
+        # a separate string object, so NA checks and comparisons run on the int8 codes
+        for col in cls._SHORT_CODE_COLUMNS:
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = df[col].astype('category')
+        return df
+    
     def load_data(self):
         """Load the CSV files into pandas DataFrames"""
+        self._product_name_col = None
+        self._id_col = _UNRESOLVED
+        self._removed_missing_counts = None
         try:
             if os.path.exists('active_tools.csv'):
-                self.active_tools = pd.read_csv('active_tools.csv')
+                self.active_tools = self._read_tool_csv('active_tools.csv')
                 # Loaded active_tools.csv
             else:
                 logger.warning("active_tools.csv not found")
                 
             if os.path.exists('removed_tools.csv'):
-                self.removed_tools = pd.read_csv('removed_tools.csv')
+                self.removed_tools = self._read_tool_csv('removed_tools.csv')
                 # Loaded removed_tools.csv
             else:
                 logger.warning("removed_tools.csv not found")
@@ -105,6 +605,341 @@ class DataAuditTools:
             logger.error(f"Error loading CSV files: {e}")
             raise
     
+    def _call_gemini_with_backoff(self, prompt: str, config: Dict[str, Any] = None, retries: int = 5) -> str:
+        """
+        Stream a prompt's response from Gemini, retrying rate-limit, transient server
+        and transport errors with jittered exponential backoff
+        
+        Requests that still fail count towards the circuit breaker; failures are never
+        cached, so a later run asks again.
+        
+        Args:
+            prompt: Prompt text to send
+            config: Optional generate_content config (e.g. tools)
+            retries: Total number of attempts before giving up
+            
+        Returns:
+            The full response text
+        """
+        for attempt in range(retries):
+            self._circuit_breaker.check()
+            self._rate_limiter.acquire()
+            try:
+                # Chunks are read as they are generated instead of waiting for the whole
+                # response; grounding metadata chunks carry no text
+                chunks = self.model.models.generate_content_stream(model="gemini-2.0-flash", contents=prompt, config=config)
+                response_text = ''.join(chunk.text for chunk in chunks if chunk.text)
+            except (genai_errors.APIError, *self.RETRYABLE_TRANSPORT_ERRORS) as e:
+                if isinstance(e, genai_errors.APIError):
+                    if e.code not in self.RETRYABLE_STATUS_CODES:
+                        raise
+                    failure = f"Gemini returned {e.code}"
+                else:
+                    failure = f"Gemini request failed ({type(e).__name__}: {e})"
+                if attempt == retries - 1:
+                    self._circuit_breaker.record_failure()
+                    raise
+                # Jitter keeps batches that failed together from retrying in lockstep
+                delay = 2 ** attempt + random.uniform(0, 1)
+                logger.warning(f"{failure}, retrying in {delay:.1f}s (attempt {attempt + 1}/{retries})")
+                time.sleep(delay)
+            else:
+                self._circuit_breaker.record_success()
+                return response_text
+    
+    def _generate_cached(self, prompt: str, config: Dict[str, Any] = None) -> str:
+        """
+        Return Gemini's response text for a prompt, serving repeats from the response cache
+        
+        Identical requests made while one is already in flight (or among the last
+        INFLIGHT_LIMIT requests) wait for and share that response instead of
+        calling the API again. Failed requests are not shared with later callers.
+        """
+        key = GeminiCache.make_key("gemini-2.0-flash", prompt, config)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+                if len(self._inflight) > self.INFLIGHT_LIMIT:
+                    self._inflight.popitem(last=False)
+            else:
+                self._inflight.move_to_end(key)
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            response_text = self._fetch_response(key, prompt, config)
+        except Exception as e:
+            with self._inflight_lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+            future.set_exception(e)
+            raise
+        future.set_result(response_text)
+        return response_text
+    
+    def _fetch_response(self, key: str, prompt: str, config: Dict[str, Any] = None) -> str:
+        """Read a response from the on-disk cache, or request it from Gemini and store it"""
+        if self.cache is None:
+            return self._call_gemini_with_backoff(prompt, config=config)
+        
+        response_text = self.cache.get(key)
+        if response_text is not None:
+            return response_text
+        
+        response_text = self._call_gemini_with_backoff(prompt, config=config)
+        if response_text:
+            self.cache.set(key, response_text)
+        return response_text
+    
+    def _row_suggestion_store_path(self) -> str:
+        """Shelf of parsed missing-value suggestions keyed by prompt version and row content hash, kept in the cache directory"""
+        return os.path.join(self.cache.cache_dir, 'row_suggestions')
+    
+    @staticmethod
+    def _stored_suggestion_is_fresh(stored: Any, stored_after: datetime) -> bool:
+        """Check that a row_suggestions entry has the current layout and was stored after the given time"""
+        try:
+            return datetime.fromisoformat(stored['created_at']) > stored_after
+        except (TypeError, KeyError, ValueError):
+            return False
+    
+    def invalidate_cache(self, version: str = None) -> int:
+        """
+        Drop cached Gemini responses and stored row suggestions
+        
+        Args:
+            version: Only drop entries made under this PROMPT_VERSION. If None, drop everything
+            
+        Returns:
+            Number of entries removed
+        """
+        if self.cache is None:
+            return 0
+        
+        removed = self.cache.invalidate(version)
+        with shelve.open(self._row_suggestion_store_path()) as store:
+            stale_keys = [key for key in store.keys() if version is None or key.startswith(f"{version}:")]
+            for key in stale_keys:
+                del store[key]
+        removed += len(stale_keys)
+        
+        logger.info(f"Removed {removed} cached entries")
+        return removed
+    
+    @staticmethod
+    def _to_compact_json(data: Any) -> str:
+        """Serialize prompt data as JSON without the whitespace padding of the default repr"""
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=str)
+    
+    @staticmethod
+    def _parse_json_array(response_text: str):
+        """
+        Extract and parse the JSON array embedded in a model response
+        
+        Returns:
+            The parsed array, or None when the response contains no array. A truncated
+            array yields the records that arrived complete; raises orjson.JSONDecodeError
+            (a json.JSONDecodeError) when not even one record can be recovered.
+        """
+        # Well-formed responses are the bare array, so try the whole text first and only
+        # scan for the bracketed span when the model wrapped it in prose or a code fence
+        try:
+            parsed = orjson.loads(response_text)
+            if isinstance(parsed, list):
+                return parsed
+        except orjson.JSONDecodeError:
+            pass
+        fenced = _JSON_FENCE_RE.search(response_text)
+        if fenced is not None:
+            try:
+                return orjson.loads(fenced.group(1))
+            except orjson.JSONDecodeError:
+                pass
+        match = _JSON_ARRAY_RE.search(response_text)
+        if match is not None:
+            try:
+                return orjson.loads(match.group())
+            except orjson.JSONDecodeError:
+                # Salvage from the full text: a cut-off array's last ']' may belong to a nested list
+                salvaged = _salvage_json_array(response_text[match.start():])
+                if not salvaged:
+                    raise
+        else:
+            # No closing bracket: either no array at all or a response cut off mid-array
+            salvaged = _salvage_json_array(response_text)
+            if not salvaged:
+                return None
+        logger.warning(f"Recovered {len(salvaged)} complete records from a truncated JSON response")
+        return salvaged
+    
+    @classmethod
+    def _validate_contradictions_response(cls, response_text: str):
+        """
+        Tool records of a contradiction check response, reduced to the schema fields
+        
+        Returns:
+            List of record dicts, or None when the response contains no array.
+            Raises json.JSONDecodeError on malformed JSON.
+        """
+        try:
+            # Structured output is normally a bare array that matches the schema exactly
+            return _CONTRADICTIONS_ADAPTER.dump_python(_CONTRADICTIONS_ADAPTER.validate_json(response_text))
+        except ValidationError:
+            # Wrapped, truncated or loosely shaped output: extract it and fill in missing fields
+            parsed = cls._parse_json_array(response_text)
+            return None if parsed is None else _validate_tool_records(parsed, _CONTRADICTION_FIELDS)
+    
+    @staticmethod
+    def _validate_contradictions_and_removals_response(response_text: str):
+        """
+        Contradiction records and removals of a combined check response
+        
+        Returns:
+            Dict with 'contradictions' and 'removals' lists, or None when the response
+            holds no JSON object
+        """
+        try:
+            return ContradictionsAndRemovals.model_validate_json(response_text).model_dump()
+        except ValidationError:
+            pass
+        # Wrapped or loosely shaped output: extract the object and fill in missing fields
+        try:
+            parsed = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            match = _JSON_OBJECT_RE.search(response_text)
+            try:
+                parsed = orjson.loads(match.group()) if match else None
+            except orjson.JSONDecodeError:
+                parsed = None
+        if not isinstance(parsed, dict):
+            return None
+        contradictions = parsed.get('contradictions')
+        removals = parsed.get('removals')
+        return {
+            'contradictions': _validate_tool_records(contradictions if isinstance(contradictions, list) else [], _CONTRADICTION_FIELDS),
+            'removals': [
+                {'tool_name': removal['tool_name'], 'reason': str(removal.get('reason', ''))}
+                for removal in (removals if isinstance(removals, list) else [])
+                if isinstance(removal, dict) and isinstance(removal.get('tool_name'), str) and removal['tool_name'].strip()
+            ]
+        }
+    
+    def _prompt_records(self, batch_tools: pd.DataFrame, columns: List[str]) -> str:
+        """
+        JSON records for a batch prompt restricted to the product name column plus the
+        given columns, skipping any the sheet does not have. Empty cells become null.
+        """
+        wanted = self._prompt_columns(batch_tools, columns)
+        # orjson over column lists rather than DataFrame.to_json, which escapes every '/' in URLs and headers
+        values = [batch_tools[col].tolist() for col in wanted]
+        records = [dict(zip(wanted, row)) for row in zip(*values)]
+        return orjson.dumps(records, default=str).decode('utf-8')
+    
+    def _prompt_columns(self, df: pd.DataFrame, columns: List[str]) -> List[str]:
+        """The product name column plus the given columns, skipping any the sheet does not have"""
+        return [col for col in dict.fromkeys([self.get_product_name_column(), *columns]) if col in df.columns]
+    
+    def _prompt_view(self, df: pd.DataFrame, columns: List[str], max_chars: int = 400) -> pd.DataFrame:
+        """
+        The prompt columns of a sheet as strings cut to max_chars, built once per check
+        
+        Batches are positional slices of this frame, so the column selection and trimming
+        run once over the sheet instead of once per batch.
+        """
+        return pd.DataFrame(
+            {col: df[col].astype('string').str.slice(0, max_chars) for col in self._prompt_columns(df, columns)},
+            index=df.index
+        )
+    
+    @staticmethod
+    def _serialize_batch(batch_view: pd.DataFrame) -> str:
+        """
+        Pipe-separated CSV of a batch of a _prompt_view for the free-text prompts
+        
+        Column names appear once in the header instead of once per tool, which keeps
+        the prompts several times smaller than JSON records.
+        """
+        return batch_view.to_csv(index=False, sep='|', lineterminator='\n')
+    
+    @staticmethod
+    def _column_values(df: pd.DataFrame, column: str, default: Any) -> List[Any]:
+        """Values of a column as a plain list, or default for every row when the column is absent"""
+        if column in df.columns:
+            return df[column].tolist()
+        return [default] * len(df)
+    
+    @staticmethod
+    def _ensure_name_column(df: pd.DataFrame, column: str) -> None:
+        """
+        Make a name column a NaN-free string column for grouping, writing it back only when
+        it is not one already so repeated calls skip the full-column copy
+        """
+        values = df[column]
+        if not isinstance(values.dtype, pd.StringDtype) or values.isna().any():
+            df[column] = values.fillna('Unknown').astype('string')
+    
+    def _token_bounded_batches(self, records: List[Dict[str, Any]], batch_size: int) -> List[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Split prompt records into batches of batch_size, halving any batch whose
+        serialized payload would exceed MAX_BATCH_PAYLOAD_TOKENS
+        
+        Returns:
+            List of (start position, batch records) tuples in input order
+        """
+        pending = deque((start, records[start:start + batch_size]) for start in range(0, len(records), batch_size))
+        batches = []
+        while pending:
+            start, batch = pending.popleft()
+            # Roughly four characters per token for English text and JSON
+            estimated_tokens = len(self._to_compact_json(batch)) // 4
+            if len(batch) > 1 and estimated_tokens > self.MAX_BATCH_PAYLOAD_TOKENS:
+                half = len(batch) // 2
+                # Second half first, so the first half is taken next and input order is kept
+                pending.appendleft((start + half, batch[half:]))
+                pending.appendleft((start, batch[:half]))
+            else:
+                batches.append((start, batch))
+        return batches
+    
+    @staticmethod
+    def _iter_batches(df: pd.DataFrame, batch_size: int):
+        """
+        Yield (batch_number, start_idx, end_idx, batch_tools) for consecutive row batches
+        
+        Positional slices share the frame's data under pandas copy-on-write, so a batch
+        never copies its rows unless something writes to it.
+        """
+        total = len(df)
+        for batch_number, start_idx in enumerate(range(0, total, batch_size), 1):
+            end_idx = min(start_idx + batch_size, total)
+            yield batch_number, start_idx, end_idx, df.iloc[start_idx:end_idx]
+    
+    def _map_concurrently(self, func, items) -> List[Any]:
+        """
+        Run func over items on a bounded thread pool, returning results in input order
+        
+        Gemini batch calls are network-bound, so several batches can wait on the
+        API at the same time. func is expected to handle its own errors.
+        """
+        return list(self._iter_concurrently(func, items))
+    
+    def _iter_concurrently(self, func, items):
+        """
+        Run func over items on a bounded thread pool, yielding results in input order
+        
+        Every item is submitted up front; each result is yielded as soon as it and all
+        results before it are ready, so the caller can consume early batches while
+        later ones are still waiting on the API.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(func, item) for item in items]
+            for future in futures:
+                yield future.result()
+    
     def get_data_summary(self) -> Dict[str, Any]:
         """Get a summary of the loaded data"""
         summary = {}
@@ -113,14 +948,14 @@ class DataAuditTools:
             summary['active_tools'] = {
                 'total_rows': len(self.active_tools),
                 'columns': list(self.active_tools.columns),
-                'sample_data': self.active_tools.head(3).to_dict('records')
+                'sample_data': self.active_tools.head(3).to_csv(index=False)
             }
         
         if self.removed_tools is not None:
             summary['removed_tools'] = {
                 'total_rows': len(self.removed_tools),
                 'columns': list(self.removed_tools.columns),
-                'sample_data': self.removed_tools.head(3).to_dict('records')
+                'sample_data': self.removed_tools.head(3).to_csv(index=False)
             }
         
         return summary
@@ -136,164 +971,109 @@ class DataAuditTools:
         if self.active_tools is not None:
             # Process available columns in active_tools
             
-            # Define the 8 essential requirements for a complete tool entry
-            essential_requirements = {
-                'built_in_or_at': ['Built-in', 'AT (Installed)'],  # Must have 'B' or 'I'
-                'pricing': ['FREE', 'Free Trial', 'Lifetime License', 'Subscription'],  # Must have at least one
-                'accessibility_categories': ['Reading', 'Cognitive', 'Executive Function', 'Vision', 'Physical', 'Hearing', 'Speech/ Communication', 'Training/ Therapy'],  # Must have at least one
-                'os_compatibility': ['Windows', 'Macintosh', 'Chromebook', 'iPad (iPadOS)', 'iPhone (iOS)', 'Android'],  # Must have at least one
-                'id_tag': ['ID TAG'],  # Must have value
-                'product_name': ['PRODUCT/FEATURE\nNAME'],  # Must have value
-                'description': ['DESCRIPTION'],  # Must have value
-                'vendor_website': ["LINK TO DESCRIPTION ON VENDOR'S WEBSITE"]  # Must have value
-            }
+            essential_requirements = self._ESSENTIAL_REQUIREMENTS
             
             # Analyze each tool for completeness
-            tools_analysis = []
-            total_tools = len(self.active_tools)
+            df = self.active_tools
+            total_tools = len(df)
+            total_requirements = len(essential_requirements)
             
-            # Process Built-in and AT (Installed) columns
+            # Evaluate every requirement column once as a boolean mask instead of row by row.
+            # Absent columns count as missing, matching the old tool.get(col, '') behaviour.
+            # read_csv maps exact placeholders like 'nan'/'None' to NaN; padded or differently
+            # cased ones (' N/A ', 'NONE') are caught by one set-membership test per column.
+            column_text = {}
+            column_present = {}
+            for cols in essential_requirements.values():
+                for col in cols:
+                    if col in df.columns:
+                        series = df[col]
+                        text = series.astype('string').str.strip()
+                        if pd.api.types.is_float_dtype(series):
+                            # Empty columns are parsed as float64; test NaN directly on the array
+                            missing = np.isnan(series.to_numpy())
+                        else:
+                            missing = (series.isna() | text.str.lower().isin(self._NA_SET)).to_numpy(dtype=bool)
+                        column_text[col] = text.fillna('nan')
+                        column_present[col] = ~missing
+                    else:
+                        column_text[col] = pd.Series('', index=df.index, dtype=object)
+                        column_present[col] = np.zeros(total_tools, dtype=bool)
             
-            for idx, tool in self.active_tools.iterrows():
-                tool_analysis = {
-                    'row_index': idx,
-                    'tool_name': tool.get('PRODUCT/FEATURE\nNAME', 'Unknown'),
-                    'is_complete': True,
-                    'missing_requirements': [],
-                    'current_values': {},
-                    'completeness_score': 0
-                }
-                
-                # Check each requirement
-                requirements_met = 0
-                total_requirements = len(essential_requirements)
-                
-                # 1. Check Built-in or AT Installed
-                built_in = str(tool.get('Built-in', '')).strip()
-                at_installed = str(tool.get('AT (Installed)', '')).strip()
-                
-                # Process built-in and AT installed values
-                
-                # Check if either column has a meaningful value (not empty, not 'nan', not 'None')
-                if (built_in and built_in != 'nan' and built_in != 'None' and built_in != '') or (at_installed and at_installed != 'nan' and at_installed != 'None' and at_installed != ''):
-                    requirements_met += 1
-                    tool_analysis['current_values']['built_in_or_at'] = f"Built-in: {built_in}, AT: {at_installed}"
-                else:
-                    tool_analysis['is_complete'] = False
-                    tool_analysis['missing_requirements'].append('built_in_or_at')
-                    tool_analysis['current_values']['built_in_or_at'] = 'MISSING'
-                
-                # 2. Check Pricing (at least one required)
-                pricing_found = False
-                pricing_values = []
-                for pricing_col in essential_requirements['pricing']:
-                    value = str(tool.get(pricing_col, '')).strip()
-                    if value and value != 'nan':
-                        pricing_found = True
-                        pricing_values.append(f"{pricing_col}: {value}")
-                
-                if pricing_found:
-                    requirements_met += 1
-                    tool_analysis['current_values']['pricing'] = ' | '.join(pricing_values)
-                else:
-                    tool_analysis['is_complete'] = False
-                    tool_analysis['missing_requirements'].append('pricing')
-                    tool_analysis['current_values']['pricing'] = 'MISSING'
-                
-                # 3. Check Accessibility Categories (at least one required)
-                categories_found = False
-                category_values = []
-                for category_col in essential_requirements['accessibility_categories']:
-                    value = str(tool.get(category_col, '')).strip()
-                    if value and value != 'nan':
-                        categories_found = True
-                        category_values.append(f"{category_col}: {value}")
-                
-                if categories_found:
-                    requirements_met += 1
-                    tool_analysis['current_values']['accessibility_categories'] = ' | '.join(category_values)
-                else:
-                    tool_analysis['is_complete'] = False
-                    tool_analysis['missing_requirements'].append('accessibility_categories')
-                    tool_analysis['current_values']['accessibility_categories'] = 'MISSING'
-                
-                # 4. Check OS Compatibility (at least one required)
-                os_found = False
-                os_values = []
-                for os_col in essential_requirements['os_compatibility']:
-                    value = str(tool.get(os_col, '')).strip()
-                    if value and value != 'nan':
-                        os_found = True
-                        os_values.append(f"{os_col}: {value}")
-                
-                if os_found:
-                    requirements_met += 1
-                    tool_analysis['current_values']['os_compatibility'] = ' | '.join(os_values)
-                else:
-                    tool_analysis['is_complete'] = False
-                    tool_analysis['missing_requirements'].append('os_compatibility')
-                    tool_analysis['current_values']['os_compatibility'] = 'MISSING'
-                
-                # 5. Check ID TAG
-                id_tag = str(tool.get('ID TAG', '')).strip()
-                if id_tag and id_tag != 'nan':
-                    requirements_met += 1
-                    tool_analysis['current_values']['id_tag'] = id_tag
-                else:
-                    tool_analysis['is_complete'] = False
-                    tool_analysis['missing_requirements'].append('id_tag')
-                    tool_analysis['current_values']['id_tag'] = 'MISSING'
-                
-                # 6. Check Product Name
-                product_name = str(tool.get('PRODUCT/FEATURE\nNAME', '')).strip()
-                if product_name and product_name != 'nan':
-                    requirements_met += 1
-                    tool_analysis['current_values']['product_name'] = product_name
-                else:
-                    tool_analysis['is_complete'] = False
-                    tool_analysis['missing_requirements'].append('product_name')
-                    tool_analysis['current_values']['product_name'] = 'MISSING'
-                
-                # 7. Check Description
-                description = str(tool.get('DESCRIPTION', '')).strip()
-                if description and description != 'nan':
-                    requirements_met += 1
-                    tool_analysis['current_values']['description'] = description[:100] + "..." if len(description) > 100 else description
-                else:
-                    tool_analysis['is_complete'] = False
-                    tool_analysis['missing_requirements'].append('description')
-                    tool_analysis['current_values']['description'] = 'MISSING'
-                
-                # 8. Check Vendor Website
-                vendor_website = str(tool.get("LINK TO DESCRIPTION ON VENDOR'S WEBSITE", '')).strip()
-                if vendor_website and vendor_website != 'nan':
-                    requirements_met += 1
-                    tool_analysis['current_values']['vendor_website'] = vendor_website
-                else:
-                    tool_analysis['is_complete'] = False
-                    tool_analysis['missing_requirements'].append('vendor_website')
-                    tool_analysis['current_values']['vendor_website'] = 'MISSING'
-                
-                # Calculate completeness score
-                tool_analysis['completeness_score'] = (requirements_met / total_requirements) * 100
-                tools_analysis.append(tool_analysis)
+            # Score on a plain (tools x requirements) uint8 matrix. The columns of each group are
+            # contiguous, so one logical_or.reduceat collapses every group in a single pass.
+            requirement_names = list(essential_requirements)
+            present_matrix = np.column_stack([column_present[col] for cols in essential_requirements.values() for col in cols])
+            group_starts = np.cumsum([0] + [len(cols) for cols in essential_requirements.values()])[:-1]
+            met_mask = np.logical_or.reduceat(present_matrix, group_starts, axis=1).astype(np.uint8)
+            requirements_met = met_mask.sum(axis=1)
+            is_complete = requirements_met == total_requirements
+            completeness_score = requirements_met / total_requirements * 100
+            met_df = pd.DataFrame(met_mask.astype(bool), index=df.index, columns=requirement_names)
+            
+            # Display strings are only built for the rows where a requirement is met;
+            # every other row shows 'MISSING'
+            current_values_columns = {}
+            for req, cols in essential_requirements.items():
+                met = met_df[req].to_numpy()
+                value = pd.Series('MISSING', index=df.index, dtype=object)
+                if met.any():
+                    if req == 'built_in_or_at':
+                        shown = 'Built-in: ' + column_text['Built-in'][met] + ', AT: ' + column_text['AT (Installed)'][met]
+                    elif req == 'description':
+                        description = column_text['DESCRIPTION'][met]
+                        shown = description.where(description.str.len() <= 100, description.str[:100] + '...')
+                    elif len(cols) == 1:
+                        shown = column_text[cols[0]][met]
+                    else:
+                        shown = pd.Series('', index=df.index[met], dtype=object)
+                        for col in cols:
+                            present = column_present[col][met]
+                            separator = pd.Series(' | ', index=shown.index, dtype=object).where(shown != '', '')
+                            shown = shown.where(~present, shown + separator + col + ': ' + column_text[col][met])
+                    value.loc[met] = shown.to_numpy()
+                current_values_columns[req] = value.tolist()
+            
+            if 'PRODUCT/FEATURE\nNAME' in df.columns:
+                # Missing names become None so prompts serialize them as null rather than NaN
+                product_names = df['PRODUCT/FEATURE\nNAME']
+                tool_names = product_names.astype(object).where(product_names.notna(), None).tolist()
+            else:
+                tool_names = ['Unknown'] * total_tools
+            # Positions of each requirement in the itertuples rows (slot 0 holds the index)
+            requirement_positions = [(req, position + 1) for position, req in enumerate(requirement_names)]
+            
+            tools_analysis = []
+            for row, tool_name, complete, score, values in zip(
+                    met_df.itertuples(index=True, name=None), tool_names, is_complete.tolist(),
+                    completeness_score.tolist(), zip(*current_values_columns.values())):
+                tools_analysis.append({
+                    'row_index': row[0],
+                    'tool_name': tool_name,
+                    'is_complete': complete,
+                    'missing_requirements': [req for req, position in requirement_positions if not row[position]],
+                    'current_values': dict(zip(requirement_names, values)),
+                    'completeness_score': score
+                })
             
             # Calculate summary statistics
-            complete_tools = sum(1 for tool in tools_analysis if tool['is_complete'])
+            complete_tools = int(is_complete.sum())
             incomplete_tools = total_tools - complete_tools
-            avg_completeness = sum(tool['completeness_score'] for tool in tools_analysis) / total_tools
-            
-            # Group tools by missing requirements for better analysis
-            missing_requirements_summary = {}
-            for tool in tools_analysis:
-                for req in tool['missing_requirements']:
-                    if req not in missing_requirements_summary:
-                        missing_requirements_summary[req] = []
-                    missing_requirements_summary[req].append({
-                        'row_index': tool['row_index'],
-                        'tool_name': tool['tool_name'],
-                        'current_values': tool['current_values'].get(req, 'MISSING')
-                    })
+            avg_completeness = float(completeness_score.mean())
+            
+            # Group tools by missing requirements for better analysis, reading each requirement's
+            # missing rows straight off the met matrix (a missing requirement always shows 'MISSING').
+            # Requirements are listed in the order the rows first miss them.
+            row_labels = df.index.tolist()
+            missing_positions = [(req, np.flatnonzero(met_mask[:, position] == 0)) for position, req in enumerate(requirement_names)]
+            missing_positions = sorted((item for item in missing_positions if len(item[1])), key=lambda item: item[1][0])
+            missing_requirements_summary = {
+                req: [
+                    {'row_index': row_labels[position], 'tool_name': tool_names[position], 'current_values': 'MISSING'}
+                    for position in positions.tolist()
+                ]
+                for req, positions in missing_positions
+            }
             
             results['active_tools'] = {
                 'total_tools': total_tools,
@@ -305,7 +1085,9 @@ class DataAuditTools:
             }
         
         if self.removed_tools is not None:
-            missing_data = self.removed_tools.isnull().sum()
+            if self._removed_missing_counts is None:
+                self._removed_missing_counts = self.removed_tools.isnull().sum()
+            missing_data = self._removed_missing_counts
             missing_percentage = (missing_data / len(self.removed_tools)) * 100
             
             results['removed_tools'] = {
@@ -316,89 +1098,94 @@ class DataAuditTools:
         
         # Use Gemini web search to suggest fixes for missing values
         if self.active_tools is not None and results.get('active_tools', {}).get('incomplete_tools', 0) > 0:
-            all_suggestions = []
             incomplete_tools = [tool for tool in results['active_tools']['tools_analysis'] if not tool['is_complete']]
-            total_incomplete = len(incomplete_tools)
             batch_size = 15
             
-            # Process incomplete tools in batches for web search suggestions
-            for start_idx in range(0, total_incomplete, batch_size):
-                end_idx = min(start_idx + batch_size, total_incomplete)
-                batch_tools = incomplete_tools[start_idx:end_idx]
-                batch_number = (start_idx // batch_size) + 1
-                total_batches = (total_incomplete + batch_size - 1) // batch_size
+            # Rows repeating the same tool with the same gaps share one lookup. The name is part
+            # of the signature because suggested values belong to a specific product; unnamed
+            # rows are never merged.
+            representatives = {}
+            duplicate_rows = {}
+            for tool in incomplete_tools:
+                normalized_name = str(tool['tool_name']).strip().lower()
+                if normalized_name in self._NA_SET:
+                    signature = tool['row_index']
+                else:
+                    signature = (frozenset(tool['missing_requirements']), normalized_name)
+                if signature in representatives:
+                    duplicate_rows[representatives[signature]['row_index']].append(tool)
+                else:
+                    representatives[signature] = tool
+                    duplicate_rows[tool['row_index']] = []
+            
+            if len(representatives) < len(incomplete_tools):
+                logger.info(f"Looking up {len(representatives)} distinct tools for {len(incomplete_tools)} incomplete rows")
+            
+            # Rows whose essential columns hash the same as on an earlier run reuse the suggestion
+            # stored for them then, so only new or edited rows are sent to Gemini even when
+            # batch boundaries shift and the response cache misses
+            row_hashes = {}
+            reused_suggestions = []
+            tools_to_query = list(representatives.values())
+            if self.cache is not None:
+                df = self.active_tools
+                hashed_columns = [col for cols in self._ESSENTIAL_REQUIREMENTS.values() for col in cols if col in df.columns]
+                hashes = pd.util.hash_pandas_object(df[hashed_columns], index=False)
+                row_hashes = {tool['row_index']: f"{PROMPT_VERSION}:{hashes.at[tool['row_index']]}" for tool in tools_to_query}
+                # Stored suggestions expire with the response cache so web-grounded answers are refreshed
+                stored_after = datetime.now() - self.cache.ttl
+                with shelve.open(self._row_suggestion_store_path()) as store:
+                    tools_to_query = []
+                    for tool in representatives.values():
+                        stored = store.get(row_hashes[tool['row_index']])
+                        if not self._stored_suggestion_is_fresh(stored, stored_after):
+                            tools_to_query.append(tool)
+                        else:
+                            reused_suggestions.append({**stored['suggestion'], 'tool_name': tool['tool_name'], 'row_index': tool['row_index']})
+                if reused_suggestions:
+                    logger.info(f"Reusing stored suggestions for {len(reused_suggestions)} unchanged tools")
+            
+            # Send only the fields the prompt asks about
+            compact_tools = [
+                {
+                    'tool_name': tool['tool_name'],
+                    'row_index': tool['row_index'],
+                    'missing_requirements': tool['missing_requirements'],
+                    'current_values': tool['current_values']
+                }
+                for tool in tools_to_query
+            ]
+            batches = self._token_bounded_batches(compact_tools, batch_size)
+            total_batches = len(batches)
+            
+            def process_batch(numbered_batch):
+                batch_number, (start_idx, batch_tools) = numbered_batch
+                end_idx = start_idx + len(batch_tools)
                 
                 logger.info(f"Processing batch {batch_number}/{total_batches} of incomplete tools ({start_idx+1}-{end_idx}) for web search suggestions")
                 
-                prompt = f"""
-                I need you to help fix missing data for these accessibility tools by searching the web for current information.
-                
-                Batch {batch_number} of {total_batches} - Incomplete Tools {start_idx+1} to {end_idx}:
-                Total incomplete tools in this batch: {len(batch_tools)}
-                
-                Tools with missing requirements:
-                {batch_tools}
-                
-                For each tool with missing data, please search the web and provide specific suggestions for:
-                
-                1. **Built-in or AT Installed**: Should it be marked as Built-in (B) or AT Installed (I)?
-                2. **Pricing**: Is it free, free trial, lifetime license, or subscription?
-                3. **Accessibility Categories**: Which categories should it be marked for (Reading, Cognitive, Vision, Physical, Hearing, Speech, Training)?
-                4. **OS Compatibility**: Which operating systems does it support (Windows, Mac, iPad, iPhone, Android, ChromeOS)?
-                5. **ID TAG**: What should the unique identifier be?
-                6. **Product Name**: Is the current name correct and complete?
-                7. **Description**: What should the description be based on current information?
-                8. **Vendor Website**: What is the correct vendor website URL?
-                
-                IMPORTANT: Provide your suggestions in this EXACT JSON format for each tool:
-                {{
-                    "tool_name": "Exact tool name from data",
-                    "row_index": row_number,
-                    "missing_requirements": ["list", "of", "missing", "requirements"],
-                    "suggestions": [
-                        {{
-                            "requirement": "requirement_name",
-                            "current_value": "what is currently there",
-                            "suggested_value": "what should be there",
-                            "source": "web search source",
-                            "confidence": "high/medium/low",
-                            "notes": "additional notes or warnings"
-                        }}
-                    ]
-                }}
-                
-                Return ONLY the JSON array, no other text.
-                """
+                prompt = (
+                    f"{self._MISSING_VALUES_PROMPT_HEAD}\n"
+                    f"Batch {batch_number} of {total_batches} - Incomplete Tools {start_idx+1} to {end_idx}:\n"
+                    f"Total incomplete tools in this batch: {len(batch_tools)}\n"
+                    f"\n"
+                    f"Tools with missing requirements:\n"
+                    f"{self._to_compact_json(batch_tools)}\n"
+                )
                 
                 try:
                     # Use Gemini web search feature for missing value suggestions
-                    response = self.model.models.generate_content(
-                        model="gemini-2.0-flash",
-                        contents=prompt, 
-                        config={"tools": [{"google_search": {}}]}
-                    )
+                    response_text = self._generate_cached(prompt, config={"tools": [{"google_search": {}}]})
                     
                     # Try to parse the response as JSON
                     try:
-                        response_text = response.text.strip()
-                        start_idx_json = response_text.find('[')
-                        end_idx_json = response_text.rfind(']')
+                        response_text = response_text.strip()
+                        parsed_suggestions = self._parse_json_array(response_text)
                         
-                        if start_idx_json != -1 and end_idx_json != -1:
-                            json_text = response_text[start_idx_json:end_idx_json + 1]
-                            parsed_suggestions = json.loads(json_text)
+                        if parsed_suggestions is not None:
                             
                             # Validate the structure
-                            validated_suggestions = []
-                            for suggestion in parsed_suggestions:
-                                if isinstance(suggestion, dict) and 'tool_name' in suggestion:
-                                    validated_suggestion = {
-                                        'tool_name': suggestion.get('tool_name', 'Unknown'),
-                                        'row_index': suggestion.get('row_index', 0),
-                                        'missing_requirements': suggestion.get('missing_requirements', []),
-                                        'suggestions': suggestion.get('suggestions', [])
-                                    }
-                                    validated_suggestions.append(validated_suggestion)
+                            validated_suggestions = _validate_tool_records(parsed_suggestions, _SUGGESTION_FIELDS)
                             
                             batch_result = {
                                 'batch': batch_number,
@@ -421,11 +1208,11 @@ class DataAuditTools:
                             'batch': batch_number,
                             'tools_range': f"{start_idx+1}-{end_idx}",
                             'parsed_suggestions': [],
-                            'raw_analysis': response.text,
+                            'raw_analysis': response_text,
                             'parsing_error': f'JSON parsing failed: {e}'
                         }
                     
-                    all_suggestions.append(batch_result)
+                    return batch_result
                     
                 except Exception as e:
                     logger.error(f"Error getting Gemini web search suggestions for batch {batch_number}: {e}")
@@ -436,12 +1223,114 @@ class DataAuditTools:
                         'raw_analysis': f"Failed to get web search suggestions: {e}",
                         'parsing_error': f'Analysis failed: {e}'
                     }
-                    all_suggestions.append(batch_result)
+                    return batch_result
+            
+            # Process incomplete tools in batches for web search suggestions, several batches at a time
+            all_suggestions = self._map_concurrently(process_batch, enumerate(batches, 1))
+            
+            if row_hashes:
+                created_at = datetime.now().isoformat()
+                with shelve.open(self._row_suggestion_store_path()) as store:
+                    for (_, batch_tools), batch_result in zip(batches, all_suggestions):
+                        # Only keep a suggestion whose row_index and tool_name both match a tool sent
+                        # in that batch, so a misnumbered answer is never filed under another row
+                        queried_names = {tool['row_index']: str(tool['tool_name']).strip().lower() for tool in batch_tools}
+                        for suggestion in batch_result['parsed_suggestions']:
+                            row_index = suggestion['row_index']
+                            if (isinstance(row_index, int) and row_index in queried_names
+                                    and str(suggestion['tool_name']).strip().lower() == queried_names[row_index]):
+                                store[row_hashes[row_index]] = {'suggestion': suggestion, 'created_at': created_at}
+            if reused_suggestions:
+                all_suggestions.append({
+                    'batch': 'reused',
+                    'tools_range': f"{len(reused_suggestions)} unchanged tools",
+                    'parsed_suggestions': reused_suggestions,
+                    'raw_analysis': 'Suggestions stored by an earlier run for rows that have not changed since'
+                })
+            
+            # Copy each representative's suggestions to the duplicate rows it stood in for
+            for batch_result in all_suggestions:
+                copies = []
+                for suggestion in batch_result['parsed_suggestions']:
+                    row_index = suggestion['row_index']
+                    siblings = duplicate_rows.get(row_index, []) if isinstance(row_index, int) else []
+                    for sibling in siblings:
+                        copies.append({**suggestion, 'tool_name': sibling['tool_name'], 'row_index': sibling['row_index']})
+                batch_result['parsed_suggestions'].extend(copies)
             
             results['gemini_web_suggestions'] = all_suggestions
         
         return results
     
+    def _contradiction_records(self, include_removal_details: bool = False) -> List[Dict[str, Any]]:
+        """
+        Compact prompt records of the active tools: only the name, description and category
+        flags the contradiction check compares
+        
+        With include_removal_details, each record also carries the remaining removal prompt
+        columns under 'details', so removals can be judged from the same records.
+        """
+        df = self.active_tools
+        product_name_column = self.get_product_name_column()
+        category_columns = [col for col in self._CATEGORY_COLUMNS if col in df.columns]
+        product_names = df[product_name_column]
+        names = product_names.astype(object).where(product_names.notna(), None).tolist()
+        if 'DESCRIPTION' in df.columns:
+            descriptions = df['DESCRIPTION'].astype('string').str.slice(0, 500).astype(object).where(df['DESCRIPTION'].notna(), None).tolist()
+        else:
+            descriptions = [None] * len(df)
+        # Zip per-column lists into the flag dicts; avoids to_dict('records') boxing every cell through a row frame
+        category_values = [df[col].astype(object).where(df[col].notna(), None).tolist() for col in category_columns]
+        categories = [dict(zip(category_columns, flags)) for flags in zip(*category_values)] if category_columns else [{}] * len(df)
+        compact_tools = [
+            {'row_index': idx, 'tool_name': name, 'description': description, 'categories': flags}
+            for idx, name, description, flags in zip(df.index.tolist(), names, descriptions, categories)
+        ]
+        
+        if include_removal_details:
+            detail_columns = [
+                col for col in self._REMOVAL_PROMPT_COLUMNS
+                if col in df.columns and col not in (product_name_column, 'DESCRIPTION')
+            ]
+            detail_values = [df[col].astype(object).where(df[col].notna(), None).tolist() for col in detail_columns]
+            for record, details in zip(compact_tools, zip(*detail_values)):
+                record['details'] = dict(zip(detail_columns, details))
+        return compact_tools
+    
+    @staticmethod
+    def _summarize_contradictions(all_contradictions: List[Dict[str, Any]], total_batches: int) -> Dict[str, Any]:
+        """Tool-by-tool contradiction results and summary statistics from the batch results"""
+        results = {}
+        
+        # Create the improved JSON structure
+        tools_with_contradictions = []
+        
+        # Process all batches to create tool-by-tool structure
+        for batch in all_contradictions:
+            if 'parsed_contradictions' in batch and batch['parsed_contradictions']:
+                for tool in batch['parsed_contradictions']:
+                    tools_with_contradictions.append(tool)
+        
+        # Create summary statistics
+        total_tools_analyzed = len(tools_with_contradictions)
+        tools_with_issues = total_contradictions = 0
+        for tool in tools_with_contradictions:
+            contradictions = tool.get('contradictions', [])
+            if contradictions:
+                tools_with_issues += 1
+            total_contradictions += len(contradictions)
+        
+        results['tools_analysis'] = tools_with_contradictions
+        results['summary'] = {
+            'total_tools_analyzed': total_tools_analyzed,
+            'tools_with_contradictions': tools_with_issues,
+            'tools_without_contradictions': total_tools_analyzed - tools_with_issues,
+            'total_contradictions_found': total_contradictions
+        }
+        results['gemini_analysis'] = all_contradictions
+        results['total_batches_processed'] = total_batches
+        return results
+    
     def find_contradictions(self) -> Dict[str, Any]:
         """
         Find contradictions in the data using LLM analysis only
@@ -452,126 +1341,36 @@ class DataAuditTools:
         results = {}
         
         if self.active_tools is not None:
-            all_contradictions = []
-            total_tools = len(self.active_tools)
             batch_size = 15
             
-            # Process tools in batches
-            for start_idx in range(0, total_tools, batch_size):
-                end_idx = min(start_idx + batch_size, total_tools)
-                batch_tools = self.active_tools.iloc[start_idx:end_idx]
-                batch_number = (start_idx // batch_size) + 1
-                total_batches = (total_tools + batch_size - 1) // batch_size
+            compact_tools = self._contradiction_records()
+            batches = self._token_bounded_batches(compact_tools, batch_size)
+            total_batches = len(batches)
+            
+            def process_batch(numbered_batch):
+                batch_number, (start_idx, batch_tools) = numbered_batch
+                end_idx = start_idx + len(batch_tools)
                 
                 # Processing batch of tools
                 
-                prompt = f"""
-                Analyze these accessibility tools for contradictions between their descriptions and ALL accessibility category assignments.
-                
-                The accessibility categories in this database are:
-                - Reading (R)
-                - Cognitive (C) 
-                - Executive Function (E)
-                - Vision (V)
-                - Physical (P)
-                - Hearing (H)
-                - Speech/Communication (S)
-                - Training/Therapy (T)
-                
-                Batch {batch_number} of {total_batches} - Tools {start_idx+1} to {end_idx}:
-                {batch_tools.to_dict('records')}
-                
-                For each tool, analyze ALL categories:
-                1. Does the description clearly indicate it's for reading accessibility (dyslexia, reading difficulties, text-to-speech)?
-                2. Does the description clearly indicate it's for cognitive accessibility (ADHD, learning disabilities, memory support)?
-                3. Does the description clearly indicate it's for executive function support (planning, organization, time management)?
-                4. Does the description clearly indicate it's for vision accessibility (blind, low vision, visual impairments)?
-                5. Does the description clearly indicate it's for physical accessibility (mobility, motor control, switch access)?
-                6. Does the description clearly indicate it's for hearing accessibility (deaf, hard of hearing, audio impairments)?
-                7. Does the description clearly indicate it's for speech/communication accessibility (non-verbal, speech difficulties, AAC)?
-                8. Does the description clearly indicate it's for training/therapy (rehabilitation, skill development, therapeutic exercises)?
-                
-                Identify any tools where:
-                - Description mentions accessibility for one category but is marked in a different category
-                - Description clearly indicates accessibility for a category but that category is missing
-                - Category assignments seem incorrect based on the description
-                - Tools are missing categories they should have based on their description
-                
-                IMPORTANT: Provide your analysis in this EXACT JSON format for each tool:
-                {{
-                    "tool_name": "Exact tool name from data",
-                    "row_index": row_number,
-                    "current_reading_category": "R" or "nan",
-                    "current_cognitive_category": "C" or "nan", 
-                    "current_executive_function_category": "E" or "nan",
-                    "current_vision_category": "V" or "nan",
-                    "current_physical_category": "P" or "nan",
-                    "current_hearing_category": "H" or "nan",
-                    "current_speech_category": "S" or "nan",
-                    "current_training_category": "T" or "nan",
-                    "contradictions": [
-                        {{
-                            "type": "missing_category" or "incorrect_category_assignment" or "category_mismatch" or "overcategorization",
-                            "category_involved": "Reading" or "Cognitive" or "Executive Function" or "Vision" or "Physical" or "Hearing" or "Speech/Communication" or "Training/Therapy",
-                            "description": "Detailed description of the contradiction",
-                            "recommendation": "Specific recommendation for correction"
-                        }}
-                    ]
-                }}
-                
-                If a tool has NO contradictions, still include it with an empty contradictions array:
-                {{
-                    "tool_name": "Tool Name",
-                    "row_index": row_number,
-                    "current_reading_category": "R" or "nan",
-                    "current_cognitive_category": "C" or "nan",
-                    "current_executive_function_category": "E" or "nan", 
-                    "current_vision_category": "V" or "nan",
-                    "current_physical_category": "P" or "nan",
-                    "current_hearing_category": "H" or "nan",
-                    "current_speech_category": "S" or "nan",
-                    "current_training_category": "T" or "nan",
-                    "contradictions": []
-                }}
-                
-                Return ONLY the JSON array, no other text.
-                """
+                prompt = (
+                    f"{self._CONTRADICTIONS_PROMPT_HEAD}\n"
+                    f"Batch {batch_number} of {total_batches} - Tools {start_idx+1} to {end_idx}:\n"
+                    f"{self._to_compact_json(batch_tools)}\n"
+                )
                 
                 try:
-                    response = self.model.models.generate_content(model="gemini-2.0-flash", contents=prompt)
+                    response_text = self._generate_cached(prompt, config=CONTRADICTIONS_RESPONSE_CONFIG)
                     
                     # Try to parse the response as JSON
                     try:
                         # Clean the response text to extract JSON
-                        response_text = response.text.strip()
+                        response_text = response_text.strip()
                         
-                        # Find JSON array in the response
-                        start_idx_json = response_text.find('[')
-                        end_idx_json = response_text.rfind(']')
+                        # Parse and validate the JSON array in the response
+                        validated_contradictions = self._validate_contradictions_response(response_text)
                         
-                        if start_idx_json != -1 and end_idx_json != -1:
-                            json_text = response_text[start_idx_json:end_idx_json + 1]
-                            parsed_contradictions = json.loads(json_text)
-                            
-                            # Validate the structure
-                            validated_contradictions = []
-                            for tool in parsed_contradictions:
-                                if isinstance(tool, dict) and 'tool_name' in tool:
-                                    validated_tool = {
-                                        'tool_name': tool.get('tool_name', 'Unknown'),
-                                        'row_index': tool.get('row_index', 0),
-                                        'current_reading_category': tool.get('current_reading_category', 'nan'),
-                                        'current_cognitive_category': tool.get('current_cognitive_category', 'nan'),
-                                        'current_executive_function_category': tool.get('current_executive_function_category', 'nan'),
-                                        'current_vision_category': tool.get('current_vision_category', 'nan'),
-                                        'current_physical_category': tool.get('current_physical_category', 'nan'),
-                                        'current_hearing_category': tool.get('current_hearing_category', 'nan'),
-                                        'current_speech_category': tool.get('current_speech_category', 'nan'),
-                                        'current_training_category': tool.get('current_training_category', 'nan'),
-                                        'contradictions': tool.get('contradictions', [])
-                                    }
-                                    validated_contradictions.append(validated_tool)
-                            
+                        if validated_contradictions is not None:
                             batch_result = {
                                 'batch': batch_number,
                                 'tools_range': f"{start_idx+1}-{end_idx}",
@@ -594,11 +1393,11 @@ class DataAuditTools:
                             'batch': batch_number,
                             'tools_range': f"{start_idx+1}-{end_idx}",
                             'parsed_contradictions': [],
-                            'raw_analysis': response.text,
+                            'raw_analysis': response_text,
                             'parsing_error': f'JSON parsing failed: {e}'
                         }
                     
-                    all_contradictions.append(batch_result)
+                    return batch_result
                     
                 except Exception as e:
                     logger.error(f"Error getting Gemini analysis for batch {batch_number}: {e}")
@@ -609,34 +1408,95 @@ class DataAuditTools:
                         'raw_analysis': f"Failed to get AI analysis: {e}",
                         'parsing_error': f'Analysis failed: {e}'
                     }
-                    all_contradictions.append(batch_result)
-            
-            # Create the improved JSON structure
-            tools_with_contradictions = []
-            
-            # Process all batches to create tool-by-tool structure
-            for batch in all_contradictions:
-                if 'parsed_contradictions' in batch and batch['parsed_contradictions']:
-                    for tool in batch['parsed_contradictions']:
-                        tools_with_contradictions.append(tool)
-            
-            # Create summary statistics
-            total_tools_analyzed = len(tools_with_contradictions)
-            tools_with_issues = sum(1 for tool in tools_with_contradictions if tool.get('contradictions'))
-            total_contradictions = sum(len(tool.get('contradictions', [])) for tool in tools_with_contradictions)
-            
-            results['tools_analysis'] = tools_with_contradictions
-            results['summary'] = {
-                'total_tools_analyzed': total_tools_analyzed,
-                'tools_with_contradictions': tools_with_issues,
-                'tools_without_contradictions': total_tools_analyzed - tools_with_issues,
-                'total_contradictions_found': total_contradictions
-            }
-            results['gemini_analysis'] = all_contradictions
-            results['total_batches_processed'] = total_batches
+                    return batch_result
+            
+            # Process tools in batches, several batches at a time
+            all_contradictions = self._map_concurrently(process_batch, enumerate(batches, 1))
+            results = self._summarize_contradictions(all_contradictions, total_batches)
         
         return results
     
+    @classmethod
+    def _names_batch_tool(cls, tool_name: str, batch_names: List[str]) -> bool:
+        """
+        Check whether a tool name from a response refers to one of the batch's (lower-cased) tool names
+        
+        Exact matches are checked first; partial names only count from _MIN_PARTIAL_NAME_LENGTH
+        characters, since empty or very short names are contained in almost every tool name.
+        """
+        name = tool_name.strip().lower()
+        if not name:
+            return False
+        if name in batch_names:
+            return True
+        return len(name) >= cls._MIN_PARTIAL_NAME_LENGTH and any(name in batch_name for batch_name in batch_names)
+    
+    def find_contradictions_and_removals(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Run the contradiction check and the removal search with one Gemini request per batch
+        
+        Used by complete_audit in place of find_contradictions and search_tools_for_removal,
+        which would otherwise send the same tools twice.
+        
+        Returns:
+            (contradictions, tools_for_removal) shaped like the results of those two methods
+        """
+        if self.active_tools is None:
+            return {}, {}
+        
+        batch_size = 15
+        compact_tools = self._contradiction_records(include_removal_details=True)
+        batches = self._token_bounded_batches(compact_tools, batch_size)
+        total_batches = len(batches)
+        
+        def process_batch(numbered_batch):
+            batch_number, (start_idx, batch_tools) = numbered_batch
+            end_idx = start_idx + len(batch_tools)
+            batch_result = {'batch': batch_number, 'tools_range': f"{start_idx+1}-{end_idx}"}
+            
+            prompt = (
+                f"{self._CONTRADICTIONS_AND_REMOVALS_PROMPT_HEAD}\n"
+                f"Batch {batch_number} of {total_batches} - Tools {start_idx+1} to {end_idx}:\n"
+                f"{self._to_compact_json(batch_tools)}\n"
+            )
+            
+            try:
+                response_text = self._generate_cached(prompt, config=CONTRADICTIONS_AND_REMOVALS_RESPONSE_CONFIG).strip()
+            except Exception as e:
+                logger.error(f"Error getting Gemini analysis for batch {batch_number}: {e}")
+                batch_result.update({
+                    'parsed_contradictions': [],
+                    'raw_analysis': f"Failed to get AI analysis: {e}",
+                    'parsing_error': f'Analysis failed: {e}'
+                })
+                return batch_result, []
+            
+            batch_result['raw_analysis'] = response_text
+            analysis = self._validate_contradictions_and_removals_response(response_text)
+            if analysis is None:
+                logger.warning(f"Failed to parse JSON for batch {batch_number}")
+                batch_result.update({'parsed_contradictions': [], 'parsing_error': 'Could not extract JSON from response'})
+                return batch_result, []
+            
+            batch_result['parsed_contradictions'] = analysis['contradictions']
+            # Keep only removals that name a tool in this batch
+            batch_names = [str(tool['tool_name']).strip().lower() for tool in batch_tools if tool['tool_name'] is not None]
+            removals = [
+                removal for removal in analysis['removals']
+                if self._names_batch_tool(removal['tool_name'], batch_names)
+            ]
+            return batch_result, removals
+        
+        batch_outputs = self._map_concurrently(process_batch, enumerate(batches, 1))
+        
+        contradictions = self._summarize_contradictions([batch_result for batch_result, _ in batch_outputs], total_batches)
+        tools_for_removal = {
+            'tools_to_remove': [removal for _, removals in batch_outputs for removal in removals],
+            'total_tools_analyzed': len(compact_tools),
+            'total_batches_processed': total_batches
+        }
+        return contradictions, tools_for_removal
+    
         # Removed display_contradiction_results as per requirements
     
     def search_incorrect_information(self) -> Dict[str, Any]:
@@ -649,16 +1509,12 @@ class DataAuditTools:
         results = {}
         
         if self.active_tools is not None:
-            all_web_analyses = []
             total_tools = len(self.active_tools)
             batch_size = 15
+            total_batches = (total_tools + batch_size - 1) // batch_size
             
-            # Process tools in batches
-            for start_idx in range(0, total_tools, batch_size):
-                end_idx = min(start_idx + batch_size, total_tools)
-                batch_tools = self.active_tools.iloc[start_idx:end_idx]
-                batch_number = (start_idx // batch_size) + 1
-                total_batches = (total_tools + batch_size - 1) // batch_size
+            def process_batch(batch):
+                batch_number, start_idx, end_idx, batch_tools = batch
                 
                 logger.info(f"Processing batch {batch_number}/{total_batches} (tools {start_idx+1}-{end_idx}) for web verification")
                 
@@ -667,7 +1523,7 @@ class DataAuditTools:
                 For each tool, verify the following information against current web sources:
                 
                 Batch {batch_number} of {total_batches} - Tools {start_idx+1} to {end_idx}:
-                {batch_tools.to_dict('records')}
+                {self._serialize_batch(batch_tools)}
                 
                 For each tool, please search and verify:
                 1. **Pricing Information**: Is the tool actually free, subscription-based, or has a free trial?
@@ -688,17 +1544,13 @@ class DataAuditTools:
                 
                 try:
                     # Use Gemini web search feature
-                    response = self.model.models.generate_content(
-                        model="gemini-2.0-flash",
-                        contents=prompt, 
-                        config={"tools": [{"google_search": {}}]}
-                    )
+                    response_text = self._generate_cached(prompt, config={"tools": [{"google_search": {}}]})
                     batch_result = {
                         'batch': batch_number,
                         'tools_range': f"{start_idx+1}-{end_idx}",
-                        'web_analysis': response.text
+                        'web_analysis': response_text
                     }
-                    all_web_analyses.append(batch_result)
+                    return batch_result
                 except Exception as e:
                     logger.error(f"Error getting Gemini web search analysis for batch {batch_number}: {e}")
                     batch_result = {
@@ -706,7 +1558,11 @@ class DataAuditTools:
                         'tools_range': f"{start_idx+1}-{end_idx}",
                         'web_analysis': f"Failed to get web search analysis: {e}"
                     }
-                    all_web_analyses.append(batch_result)
+                    return batch_result
+            
+            # Verify several batches at a time; results keep batch order
+            prompt_view = self._prompt_view(self.active_tools, self._VERIFICATION_PROMPT_COLUMNS)
+            all_web_analyses = self._map_concurrently(process_batch, self._iter_batches(prompt_view, batch_size))
             
             results['gemini_web_analysis'] = all_web_analyses
             results['total_batches_processed'] = total_batches
@@ -724,33 +1580,46 @@ class DataAuditTools:
         results = {}
         
         if self.active_tools is not None:
-            verified_tools = []
             total_tools = len(self.active_tools)
             batch_size = 15
+            total_batches = (total_tools + batch_size - 1) // batch_size
+            
+            # The ID and product name columns are the same for every batch
+            id_column = self.get_id_column()
+            product_name_column = self.get_product_name_column()
+            prompt_columns = [id_column, *self._VERIFICATION_PROMPT_COLUMNS] if id_column else self._VERIFICATION_PROMPT_COLUMNS
+            # Select the prompt columns once; each batch is a positional slice of this frame
+            prompt_source = self.active_tools[self._prompt_columns(self.active_tools, prompt_columns)]
             
-            # Process tools in batches
-            for start_idx in range(0, total_tools, batch_size):
-                end_idx = min(start_idx + batch_size, total_tools)
-                batch_tools = self.active_tools.iloc[start_idx:end_idx]
-                batch_number = (start_idx // batch_size) + 1
-                total_batches = (total_tools + batch_size - 1) // batch_size
+            def fallback_entries(batch_tools, verification_error):
+                """Entries marking every tool in a batch as not verified, built from column lists"""
+                row_labels = batch_tools.index.tolist()
+                if product_name_column in batch_tools.columns:
+                    tool_names = batch_tools[product_name_column].tolist()
+                else:
+                    tool_names = [f"Unknown Tool (Row {idx})" for idx in row_labels]
+                tool_ids = batch_tools[id_column].tolist() if id_column else [str(idx) for idx in row_labels]
+                return [
+                    {
+                        "tool_name": tool_name,
+                        "id_tag": tool_id,
+                        "is_information_correct": None,  # None indicates verification failed
+                        "verification_error": verification_error
+                    }
+                    for tool_name, tool_id in zip(tool_names, tool_ids)
+                ]
+            
+            def process_batch(batch):
+                batch_number, start_idx, end_idx, batch_tools = batch
+                verified_tools = []
                 
                 # Processing batch for structured verification
                 
-                # Get ID column if available
-                id_column = None
-                for possible_id in ['ID', 'ID_TAG', 'TOOL_ID', 'id', 'id_tag', 'tool_id']:
-                    if possible_id in batch_tools.columns:
-                        id_column = possible_id
-                        break
-                
-                product_name_column = self.get_product_name_column()
-                
                 prompt = f"""
                 Verify the accuracy of information in these accessibility tools by searching the web.
                 
                 Batch {batch_number} of {total_batches} - Tools {start_idx+1} to {end_idx}:
-                {batch_tools.to_dict('records')}
+                {self._prompt_records(batch_tools, prompt_columns)}
                 
                 For each tool, search and verify if the information is correct.
                 
@@ -776,86 +1645,75 @@ class DataAuditTools:
                 
                 try:
                     # Use Gemini web search feature
-                    response = self.model.models.generate_content(
-                        model="gemini-2.0-flash",
-                        contents=prompt, 
-                        config={"tools": [{"google_search": {}}]}
-                    )
+                    response_text = self._generate_cached(prompt, config={"tools": [{"google_search": {}}]})
                     
                     # Extract JSON from response
-                    response_text = response.text.strip()
-                    
-                    # Try to find JSON in the response
-                    json_start = response_text.find('[')
-                    json_end = response_text.rfind(']') + 1
+                    response_text = response_text.strip()
                     
-                    if json_start >= 0 and json_end > json_start:
-                        json_str = response_text[json_start:json_end]
-                        try:
-                            batch_results = json.loads(json_str)
+                    # Parse the whole response as JSON, or the array embedded in it
+                    try:
+                        batch_results = self._parse_json_array(response_text)
+                        
+                        if batch_results is not None:
+                            # First row per ID and per name in the batch, so filling in a field the
+                            # model left out is a dict lookup rather than a scan of the batch
+                            tool_ids = batch_tools[id_column].tolist() if id_column else [str(idx) for idx in batch_tools.index.tolist()]
+                            name_by_id = {}
+                            id_by_name = {}
+                            for tool_name, tool_id in zip(batch_tools[product_name_column].tolist(), tool_ids):
+                                name_by_id.setdefault(str(tool_id), tool_name)
+                                id_by_name.setdefault(tool_name, tool_id)
                             
                             # Process each tool result
                             for tool_result in batch_results:
                                 # Ensure required fields are present
                                 if 'tool_name' not in tool_result:
                                     # Try to find the tool in the batch
-                                    for idx, row in batch_tools.iterrows():
-                                        if id_column and str(row.get(id_column, '')) == str(tool_result.get('id_tag', '')):
-                                            tool_result['tool_name'] = row.get(product_name_column, 'Unknown')
-                                            break
+                                    if id_column and str(tool_result.get('id_tag', '')) in name_by_id:
+                                        tool_result['tool_name'] = name_by_id[str(tool_result.get('id_tag', ''))]
                                 
                                 # If id_tag is missing, try to find it
                                 if 'id_tag' not in tool_result or not tool_result['id_tag']:
-                                    for idx, row in batch_tools.iterrows():
-                                        if row.get(product_name_column, '') == tool_result.get('tool_name', ''):
-                                            tool_result['id_tag'] = row.get(id_column, str(idx)) if id_column else str(idx)
-                                            break
+                                    tool_name = tool_result.get('tool_name', '')
+                                    if isinstance(tool_name, str) and tool_name in id_by_name:
+                                        tool_result['id_tag'] = id_by_name[tool_name]
                                 
                                 verified_tools.append(tool_result)
-                                
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Error parsing JSON from batch {batch_number}: {e}")
+                        else:
+                            logger.error(f"No JSON found in response for batch {batch_number}")
                             # Create a fallback entry for each tool in the batch
-                            for idx, row in batch_tools.iterrows():
-                                tool_name = row.get(product_name_column, f"Unknown Tool (Row {idx})")
-                                tool_id = row.get(id_column, str(idx)) if id_column else str(idx)
-                                verified_tools.append({
-                                    "tool_name": tool_name,
-                                    "id_tag": tool_id,
-                                    "is_information_correct": None,  # None indicates verification failed
-                                    "verification_error": f"Failed to parse JSON response for batch {batch_number}"
-                                })
-                    else:
-                        logger.error(f"No JSON found in response for batch {batch_number}")
-                        # Create a fallback entry for each tool in the batch
-                        for idx, row in batch_tools.iterrows():
-                            tool_name = row.get(product_name_column, f"Unknown Tool (Row {idx})")
-                            tool_id = row.get(id_column, str(idx)) if id_column else str(idx)
-                            verified_tools.append({
-                                "tool_name": tool_name,
-                                "id_tag": tool_id,
-                                "is_information_correct": None,  # None indicates verification failed
-                                "verification_error": f"No JSON found in response for batch {batch_number}"
-                            })
+                            verified_tools.extend(fallback_entries(batch_tools, f"No JSON found in response for batch {batch_number}"))
                             
+                    except json.JSONDecodeError as e:
+                        logger.error(f"Error parsing JSON from batch {batch_number}: {e}")
+                        # Create a fallback entry for each tool in the batch
+                        verified_tools.extend(fallback_entries(batch_tools, f"Failed to parse JSON response for batch {batch_number}"))
+                    
                 except Exception as e:
                     logger.error(f"Error getting Gemini analysis for batch {batch_number}: {e}")
                     # Create a fallback entry for each tool in the batch
-                    for idx, row in batch_tools.iterrows():
-                        tool_name = row.get(product_name_column, f"Unknown Tool (Row {idx})")
-                        tool_id = row.get(id_column, str(idx)) if id_column else str(idx)
-                        verified_tools.append({
-                            "tool_name": tool_name,
-                            "id_tag": tool_id,
-                            "is_information_correct": None,  # None indicates verification failed
-                            "verification_error": f"Failed to get AI analysis: {e}"
-                        })
+                    verified_tools.extend(fallback_entries(batch_tools, f"Failed to get AI analysis: {e}"))
+                
+                return verified_tools
+            
+            # Verify several batches at a time, then flatten in batch order
+            verified_tools = [
+                tool
+                for batch_verified in self._map_concurrently(process_batch, self._iter_batches(prompt_source, batch_size))
+                for tool in batch_verified
+            ]
             
             # Calculate statistics
             total_verified = len(verified_tools)
-            correct_count = sum(1 for tool in verified_tools if tool.get('is_information_correct') is True)
-            incorrect_count = sum(1 for tool in verified_tools if tool.get('is_information_correct') is False)
-            failed_count = sum(1 for tool in verified_tools if tool.get('is_information_correct') is None)
+            correct_count = incorrect_count = failed_count = 0
+            for tool in verified_tools:
+                outcome = tool.get('is_information_correct')
+                if outcome is True:
+                    correct_count += 1
+                elif outcome is False:
+                    incorrect_count += 1
+                elif outcome is None:
+                    failed_count += 1
             
             results['verified_tools'] = verified_tools
             results['total_tools_analyzed'] = total_tools
@@ -874,6 +1732,9 @@ class DataAuditTools:
         """
         Validate that the duplicate results have the correct structure
         
+        find_duplicates builds its result from fixed keys and no longer runs this on every
+        call; it is kept for checking results loaded back from a saved audit.
+        
         Args:
             results: Results from find_duplicates function
             
@@ -957,6 +1818,52 @@ class DataAuditTools:
     
     # Removed display_missing_values_results as per requirements
     
+    def _duplicate_name_groups(self, df: pd.DataFrame, product_name_col: str) -> List[Dict[str, Any]]:
+        """
+        Groups of rows sharing a product name, ordered by name
+        
+        One groupby finds the names with more than one row; only those rows are read
+        back from the frame, in a single positional take.
+        """
+        duplicate_groups = df.groupby(product_name_col)
+        group_sizes = duplicate_groups.size()
+        duplicate_names = group_sizes.index[group_sizes > 1].tolist()
+        if not duplicate_names:
+            return []
+        
+        group_positions = [duplicate_groups.indices[name] for name in duplicate_names]
+        rows = df.iloc[np.concatenate(group_positions)]
+        tools = [
+            {
+                'row_index': row_index,
+                'tool_name': tool_name,
+                'company': company,
+                'description': description,
+                'notes': note,
+                'link': link
+            }
+            for row_index, tool_name, company, description, note, link in zip(
+                rows.index.tolist(),
+                rows[product_name_col].tolist(),
+                self._column_values(rows, 'COMPANY', 'Unknown'),
+                self._column_values(rows, 'DESCRIPTION', ''),
+                self._column_values(rows, 'AUDITOR NOTES', ''),
+                self._column_values(rows, "LINK TO DESCRIPTION ON VENDOR'S WEBSITE", '')
+            )
+        ]
+        
+        # Slice the tool entries back into their groups
+        groups = []
+        offset = 0
+        for name, positions in zip(duplicate_names, group_positions):
+            groups.append({
+                'duplicate_group_name': name,
+                'count': len(positions),
+                'tools': tools[offset:offset + len(positions)]
+            })
+            offset += len(positions)
+        return groups
+    
     def find_duplicates(self) -> Dict[str, Any]:
         """
         Search for duplicate entries with improved JSON structure
@@ -978,38 +1885,10 @@ class DataAuditTools:
             # Ensure the product name column is properly formatted for grouping
             try:
                 # Convert to string and fill NaN values to avoid groupby issues
-                self.active_tools[product_name_col] = self.active_tools[product_name_col].fillna('Unknown').astype(str)
-                
-                # Group by product name and find groups with more than 1 item
-                grouped_duplicates = self.active_tools.groupby(product_name_col).filter(lambda x: len(x) > 1)
+                self._ensure_name_column(self.active_tools, product_name_col)
                 
                 # Organize potential duplicates into groups
-                potential_duplicate_groups = []
-                if not grouped_duplicates.empty:
-                    # Group by product name to get the actual duplicate groups
-                    duplicate_groups = self.active_tools.groupby(product_name_col)
-                    for name, group in duplicate_groups:
-                        if len(group) > 1:
-                            # Create a group entry with all duplicate tools
-                            group_entry = {
-                                'duplicate_group_name': name,
-                                'count': len(group),
-                                'tools': []
-                            }
-                            
-                            # Add each tool in the duplicate group
-                            for idx, tool in group.iterrows():
-                                tool_info = {
-                                    'row_index': idx,
-                                    'tool_name': tool[product_name_col],
-                                    'company': tool.get('COMPANY', 'Unknown'),
-                                    'description': tool.get('DESCRIPTION', ''),
-                                    'notes': tool.get('AUDITOR NOTES', ''),
-                                    'link': tool.get("LINK TO DESCRIPTION ON VENDOR'S WEBSITE", '')
-                                }
-                                group_entry['tools'].append(tool_info)
-                            
-                            potential_duplicate_groups.append(group_entry)
+                potential_duplicate_groups = self._duplicate_name_groups(self.active_tools, product_name_col)
                 
             except Exception as e:
                 logger.warning(f"Could not perform groupby operation on {product_name_col}: {e}")
@@ -1018,57 +1897,87 @@ class DataAuditTools:
             # Check for similar names (fuzzy matching) - improved structure
             similar_name_groups = []
             try:
+                # Column values as plain lists, read by position instead of building a Series per row
+                row_labels = self.active_tools.index.tolist()
+                product_names = self.active_tools[product_name_col].tolist()
+                companies = self._column_values(self.active_tools, 'COMPANY', 'Unknown')
+                descriptions = self._column_values(self.active_tools, 'DESCRIPTION', '')
+                notes = self._column_values(self.active_tools, 'AUDITOR NOTES', '')
+                
                 # Convert to string and handle non-string values before using .str accessor
                 tool_names = self.active_tools[product_name_col].dropna().astype(str).str.lower()
                 
-                # Create a dictionary to group similar names
-                similarity_groups = {}
-                
                 # Get the actual row indices from the original dataframe (before dropna)
                 original_indices = self.active_tools[product_name_col].dropna().index
                 
-                for i, (idx1, name1) in enumerate(zip(original_indices, tool_names)):
-                    for j, (idx2, name2) in enumerate(zip(original_indices[i+1:], tool_names[i+1:]), i+1):
-                        # Simple similarity check (can be improved with fuzzy matching)
-                        if name1 in name2 or name2 in name1:
-                            if len(name1) > 3 and len(name2) > 3:  # Avoid very short names
-                                # Create a key for grouping similar names
-                                base_name = min(name1, name2)
-                                if base_name not in similarity_groups:
-                                    similarity_groups[base_name] = []
-                                
-                                # Add both tools to the similarity group
-                                tool1_info = {
-                                    'row_index': int(idx1),
-                                    'tool_name': self.active_tools.loc[idx1, product_name_col],
-                                    'company': self.active_tools.loc[idx1].get('COMPANY', 'Unknown'),
-                                    'description': self.active_tools.loc[idx1].get('DESCRIPTION', ''),
-                                    'notes': self.active_tools.loc[idx1].get('AUDITOR NOTES', '')
-                                }
-                                
-                                tool2_info = {
-                                    'row_index': int(idx2),
-                                    'tool_name': self.active_tools.loc[idx2, product_name_col],
-                                    'company': self.active_tools.loc[idx2].get('COMPANY', 'Unknown'),
-                                    'description': self.active_tools.loc[idx2].get('DESCRIPTION', ''),
-                                    'notes': self.active_tools.loc[idx2].get('AUDITOR NOTES', '')
-                                }
-                                
-                                # Check if tools are already in the group
-                                if not any(t['row_index'] == tool1_info['row_index'] for t in similarity_groups[base_name]):
-                                    similarity_groups[base_name].append(tool1_info)
-                                if not any(t['row_index'] == tool2_info['row_index'] for t in similarity_groups[base_name]):
-                                    similarity_groups[base_name].append(tool2_info)
+                # Candidate pairs come from C-level str.find over all names joined into one string
+                # rather than a Python comparison of every pair. A name only contains another when
+                # the match lies inside it, since names never include the separator.
+                names = tool_names.tolist()
+                haystack = '\x00'.join(names)
+                name_starts = []
+                offset = 0
+                for name in names:
+                    name_starts.append(offset)
+                    offset += len(name) + 1
+                
+                # One scan per distinct name: a repeated name finds the same rows every time, and
+                # the rows containing a name (its own copies included) all belong to one group
+                containing_rows = []
+                for name in dict.fromkeys(names):
+                    if len(name) <= 3:  # Avoid very short names
+                        continue
+                    hits = []
+                    position = haystack.find(name)
+                    while position != -1:
+                        hits.append(bisect.bisect_right(name_starts, position) - 1)
+                        position = haystack.find(name, position + 1)
+                    hits = list(dict.fromkeys(hits))
+                    if len(hits) > 1:
+                        containing_rows.append(hits)
+                
+                # Frame positions of the named rows, for reading the column lists
+                frame_positions = self.active_tools.index.get_indexer(original_indices).tolist()
+                
+                # Union-find over the matches, so names linked through a chain (A in B, B in C)
+                # end up in one group instead of separate groups keyed by each pair's shorter name
+                parent = list(range(len(names)))
+                
+                def find_root(i):
+                    while parent[i] != i:
+                        parent[i] = parent[parent[i]]
+                        i = parent[i]
+                    return i
+                
+                for hits in containing_rows:
+                    for j in hits[1:]:
+                        root_i, root_j = find_root(hits[0]), find_root(j)
+                        if root_i != root_j:
+                            parent[max(root_i, root_j)] = min(root_i, root_j)
+                
+                # Members in row order; groups ordered by their first row
+                similarity_groups = {}
+                for i in sorted({i for hits in containing_rows for i in hits}):
+                    similarity_groups.setdefault(find_root(i), []).append(i)
                 
                 # Convert similarity groups to list format
-                for base_name, tools in similarity_groups.items():
-                    if len(tools) > 1:  # Only include groups with multiple tools
-                        similar_name_groups.append({
-                            'similarity_group_name': base_name,
-                            'count': len(tools),
-                            'tools': tools
+                for members in similarity_groups.values():
+                    tools = []
+                    for i in members:
+                        position = frame_positions[i]
+                        tools.append({
+                            'row_index': int(row_labels[position]),
+                            'tool_name': product_names[position],
+                            'company': companies[position],
+                            'description': descriptions[position],
+                            'notes': notes[position]
                         })
-                        
+                    similar_name_groups.append({
+                        'similarity_group_name': min(names[i] for i in members),
+                        'count': len(tools),
+                        'tools': tools
+                    })
+                
             except Exception as e:
                 logger.warning(f"Could not perform similar names analysis: {e}")
                 similar_name_groups = []
@@ -1092,38 +2001,10 @@ class DataAuditTools:
             # Ensure the product name column is properly formatted for grouping in removed tools
             try:
                 # Convert to string and fill NaN values to avoid groupby issues
-                self.removed_tools[product_name_col] = self.removed_tools[product_name_col].fillna('Unknown').astype(str)
-                
-                # Group by product name and find groups with more than 1 item
-                grouped_duplicates = self.removed_tools.groupby(product_name_col).filter(lambda x: len(x) > 1)
+                self._ensure_name_column(self.removed_tools, product_name_col)
                 
                 # Organize potential duplicates into groups
-                potential_duplicate_groups = []
-                if not grouped_duplicates.empty:
-                    # Group by product name to get the actual duplicate groups
-                    duplicate_groups = self.removed_tools.groupby(product_name_col)
-                    for name, group in duplicate_groups:
-                        if len(group) > 1:
-                            # Create a group entry with all duplicate tools
-                            group_entry = {
-                                'duplicate_group_name': name,
-                                'count': len(group),
-                                'tools': []
-                            }
-                            
-                            # Add each tool in the duplicate group
-                            for idx, tool in group.iterrows():
-                                tool_info = {
-                                    'row_index': idx,
-                                    'tool_name': tool[product_name_col],
-                                    'company': tool.get('COMPANY', 'Unknown'),
-                                    'description': tool.get('DESCRIPTION', ''),
-                                    'notes': tool.get('AUDITOR NOTES', ''),
-                                    'link': tool.get("LINK TO DESCRIPTION ON VENDOR'S WEBSITE", '')
-                                }
-                                group_entry['tools'].append(tool_info)
-                            
-                            potential_duplicate_groups.append(group_entry)
+                potential_duplicate_groups = self._duplicate_name_groups(self.removed_tools, product_name_col)
                 
             except Exception as e:
                 logger.warning(f"Could not perform groupby operation on removed tools {product_name_col}: {e}")
@@ -1138,12 +2019,44 @@ class DataAuditTools:
                 }
             }
         
-        # Validate the results structure before returning
-        if not self.validate_duplicate_results(results):
-            logger.warning("Duplicate results structure validation failed, but continuing...")
-        
         return results
     
+    def _keyword_matches(self, df: pd.DataFrame, pattern: re.Pattern, reason: str) -> List[Dict[str, Any]]:
+        """
+        Entries for the rows whose description or auditor notes match a keyword pattern
+        
+        Each column is scanned with the precompiled case-insensitive pattern over the whole
+        column instead of a Python keyword loop per row, skipping empty cells; only matching
+        rows are read back.
+        """
+        mask = np.zeros(len(df), dtype=bool)
+        for col in ('DESCRIPTION', 'AUDITOR NOTES'):
+            if col in df.columns:
+                text = df[col]
+                if not pd.api.types.is_string_dtype(text):
+                    # Only all-empty or oddly typed columns land here; loaded text columns already are strings
+                    text = text.astype('string')
+                filled = (text.notna() & text.str.len().gt(0)).to_numpy(dtype=bool, na_value=False)
+                if filled.any():
+                    mask[filled] |= text[filled].str.contains(pattern, na=False).to_numpy(dtype=bool)
+        
+        matched = df.iloc[np.flatnonzero(mask)]
+        return [
+            {
+                'row': row,
+                'tool_name': tool_name,
+                'reason': reason,
+                'description': description,
+                'notes': notes
+            }
+            for row, tool_name, description, notes in zip(
+                matched.index.tolist(),
+                self._column_values(matched, self.get_product_name_column(), 'Unknown'),
+                self._column_values(matched, 'DESCRIPTION', ''),
+                self._column_values(matched, 'AUDITOR NOTES', '')
+            )
+        ]
+    
     def check_tools_for_removal(self) -> Dict[str, Any]:
         """
         Check for tools that must be removed
@@ -1153,39 +2066,20 @@ class DataAuditTools:
         results = {}
         
         if self.active_tools is not None:
-            tools_to_remove = []
-            
-            # Check for tools with specific indicators
-            for idx, row in self.active_tools.iterrows():
-                description = str(row.get('DESCRIPTION', '')).lower()
-                notes = str(row.get('AUDITOR NOTES', '')).lower()
-                
-                # Check for removal indicators in description or notes
-                removal_keywords = ['remove', 'delete', 'duplicate', 'outdated', 'discontinued', 'no longer available']
-                
-                if any(keyword in description for keyword in removal_keywords) or any(keyword in notes for keyword in removal_keywords):
-                    tools_to_remove.append({
-                        'row': idx,
-                        'tool_name': row.get(self.get_product_name_column(), 'Unknown'),
-                        'reason': 'Contains removal indicators in description or notes',
-                        'description': row.get('DESCRIPTION', ''),
-                        'notes': row.get('AUDITOR NOTES', '')
-                    })
-            
-            results['tools_to_remove'] = tools_to_remove
+            # Check for removal indicators in description or notes
+            results['tools_to_remove'] = self._keyword_matches(
+                self.active_tools, self._REMOVAL_KEYWORDS_RE, 'Contains removal indicators in description or notes'
+            )
         
         # Use Gemini for analysis in batches
         if self.active_tools is not None:
-            all_analyses = []
             total_tools = len(self.active_tools)
             batch_size = 15
             
-            # Process tools in batches
-            for start_idx in range(0, total_tools, batch_size):
-                end_idx = min(start_idx + batch_size, total_tools)
-                batch_tools = self.active_tools.iloc[start_idx:end_idx]
-                batch_number = (start_idx // batch_size) + 1
-                total_batches = (total_tools + batch_size - 1) // batch_size
+            total_batches = (total_tools + batch_size - 1) // batch_size
+            
+            def process_batch(batch):
+                batch_number, start_idx, end_idx, batch_tools = batch
                 
                 logger.info(f"Processing batch {batch_number}/{total_batches} (tools {start_idx+1}-{end_idx}) for removal analysis")
                 
@@ -1193,7 +2087,7 @@ class DataAuditTools:
                 Analyze these accessibility tools to identify which ones should be removed:
                 
                 Batch {batch_number} of {total_batches} - Tools {start_idx+1} to {end_idx}:
-                {batch_tools.to_dict('records')}
+                {self._serialize_batch(batch_tools)}
                 
                 Look for:
                 1. Outdated or discontinued tools
@@ -1206,68 +2100,55 @@ class DataAuditTools:
                 """
                 
                 try:
-                    response = self.model.models.generate_content(model="gemini-2.0-flash", contents=prompt)
-                    batch_result = {
+                    return {
                         'batch': batch_number,
                         'tools_range': f"{start_idx+1}-{end_idx}",
-                        'analysis': response.text
+                        'analysis': self._generate_cached(prompt)
                     }
-                    all_analyses.append(batch_result)
                 except Exception as e:
                     logger.error(f"Error getting Gemini analysis for batch {batch_number}: {e}")
-                    batch_result = {
+                    return {
                         'batch': batch_number,
                         'tools_range': f"{start_idx+1}-{end_idx}",
                         'analysis': f"Failed to get AI analysis: {e}"
                     }
-                    all_analyses.append(batch_result)
+            
+            # Analyze several batches at a time; results stay in batch order
+            prompt_view = self._prompt_view(self.active_tools, self._REMOVAL_PROMPT_COLUMNS)
+            all_analyses = self._map_concurrently(process_batch, self._iter_batches(prompt_view, batch_size))
             
             results['gemini_analysis'] = all_analyses
             results['total_batches_processed'] = total_batches
         
         return results
     
-    def check_accidental_removals(self) -> Dict[str, Any]:
+    def check_accidental_removals(self, use_local: bool = True, use_llm: bool = True) -> Dict[str, Any]:
         """
         Check for tools that were marked 'removed' accidentally and should not be in 'removed' category
+        
+        Args:
+            use_local: Run the keyword scan of descriptions and auditor notes
+            use_llm: Run the Gemini batch analysis (network-bound, by far the slower part)
         """
         logger.info("Checking for accidental removals...")
         
         results = {}
         
-        if self.removed_tools is not None:
-            accidental_removals = []
-            
-            for idx, row in self.removed_tools.iterrows():
-                description = str(row.get('DESCRIPTION', '')).lower()
-                notes = str(row.get('AUDITOR NOTES', '')).lower()
-                
-                # Check for indicators that suggest the tool should be active
-                active_indicators = ['active', 'current', 'available', 'supported', 'working', 'functional']
-                
-                if any(keyword in description for keyword in active_indicators) or any(keyword in notes for keyword in active_indicators):
-                    accidental_removals.append({
-                        'row': idx,
-                        'tool_name': row.get(self.get_product_name_column(), 'Unknown'),
-                        'reason': 'Contains active indicators suggesting it should not be removed',
-                        'description': row.get('DESCRIPTION', ''),
-                        'notes': row.get('AUDITOR NOTES', '')
-                    })
-            
-            results['accidental_removals'] = accidental_removals
+        if self.removed_tools is not None and use_local:
+            # Check for indicators that suggest the tool should be active
+            results['accidental_removals'] = self._keyword_matches(
+                self.removed_tools, self._ACTIVE_KEYWORDS_RE, 'Contains active indicators suggesting it should not be removed'
+            )
         
         # Use Gemini for analysis in batches
-        if self.removed_tools is not None:
-            all_analyses = []
+        if self.removed_tools is not None and use_llm:
             total_tools = len(self.removed_tools)
             batch_size = 15
             
-            # Process tools in batches
-            for start_idx in range(0, total_tools, batch_size):
-                end_idx = min(start_idx + batch_size, total_tools)
-                batch_tools = self.removed_tools.iloc[start_idx:end_idx]
-                batch_number = (start_idx // batch_size) + 1
-                total_batches = (total_tools + batch_size - 1) // batch_size
+            total_batches = (total_tools + batch_size - 1) // batch_size
+            
+            def process_batch(batch):
+                batch_number, start_idx, end_idx, batch_tools = batch
                 
                 logger.info(f"Processing batch {batch_number}/{total_batches} (tools {start_idx+1}-{end_idx}) for accidental removal analysis")
                 
@@ -1275,7 +2156,7 @@ class DataAuditTools:
                 Analyze these removed accessibility tools to identify which ones might have been removed accidentally:
                 
                 Batch {batch_number} of {total_batches} - Tools {start_idx+1} to {end_idx}:
-                {batch_tools.to_dict('records')}
+                {self._serialize_batch(batch_tools)}
                 
                 Look for:
                 1. Tools that appear to be currently available and functional
@@ -1287,41 +2168,49 @@ class DataAuditTools:
                 """
                 
                 try:
-                    response = self.model.models.generate_content(model="gemini-2.0-flash", contents=prompt)
-                    batch_result = {
+                    return {
                         'batch': batch_number,
                         'tools_range': f"{start_idx+1}-{end_idx}",
-                        'analysis': response.text
+                        'analysis': self._generate_cached(prompt)
                     }
-                    all_analyses.append(batch_result)
                 except Exception as e:
                     logger.error(f"Error getting Gemini analysis for batch {batch_number}: {e}")
-                    batch_result = {
+                    return {
                         'batch': batch_number,
                         'tools_range': f"{start_idx+1}-{end_idx}",
                         'analysis': f"Failed to get AI analysis: {e}"
                     }
-                    all_analyses.append(batch_result)
+            
+            # Analyze several batches at a time; results stay in batch order
+            prompt_view = self._prompt_view(self.removed_tools, self._REMOVAL_PROMPT_COLUMNS)
+            all_analyses = self._map_concurrently(process_batch, self._iter_batches(prompt_view, batch_size))
             
             results['gemini_analysis'] = all_analyses
             results['total_batches_processed'] = total_batches
         
         return results
     
-    def complete_audit(self) -> Dict[str, Any]:
+    def complete_audit(self, use_local: bool = True, use_llm: bool = True) -> Dict[str, Any]:
         """
         Run all audit operations
+        
+        Args:
+            use_local: Run the local keyword scan of the accidental removal check
+            use_llm: Run the Gemini analysis of the accidental removal check
         """
         logger.info("Running complete audit...")
         
+        # Contradictions and removals cover the same active tools, so one request per batch answers both
+        contradictions, tools_for_removal = self.find_contradictions_and_removals()
+        
         results = {
             'timestamp': datetime.now().isoformat(),
             'missing_values': self.analyze_missing_values(),
-            'contradictions': self.find_contradictions(),
+            'contradictions': contradictions,
             'incorrect_information': self.search_incorrect_information_structured(),
             'duplicates': self.find_duplicates(),
-            'tools_for_removal': self.search_tools_for_removal(),
-            'accidental_removals': self.check_accidental_removals()
+            'tools_for_removal': tools_for_removal,
+            'accidental_removals': self.check_accidental_removals(use_local=use_local, use_llm=use_llm)
         }
         
         # Generate comprehensive summary with Gemini
@@ -1348,17 +2237,28 @@ class DataAuditTools:
         """
         
         try:
-            response = self.model.models.generate_content(model="gemini-2.0-flash", contents=summary_prompt)
-            results['comprehensive_summary'] = response.text
+            results['comprehensive_summary'] = self._generate_cached(summary_prompt)
         except Exception as e:
             logger.error(f"Error getting comprehensive summary: {e}")
             results['comprehensive_summary'] = "Failed to get comprehensive summary"
         
         return results
     
-    def save_audit_results(self, results: Dict[str, Any], filename: str = None):
+    # orjson options for saved results: numpy scalars and non-string keys are written as-is
+    _RESULTS_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    
+    def save_audit_results(self, results: Dict[str, Any], filename: str = None, jsonl: bool = False):
         """
         Save audit results to a file in the audit_results folder
+        
+        Args:
+            results: Results keyed by operation name
+            filename: Output file name; defaults to a timestamped name
+            jsonl: Write one {"operation", "result"} line per operation instead of a single
+                indented document, so only one operation is serialized at a time
+        
+        Returns:
+            The saved file's path, or None if saving failed
         """
         # Create audit_results folder if it doesn't exist
         audit_results_dir = "audit_results"
@@ -1368,18 +2268,25 @@ class DataAuditTools:
         
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"audit_results_{timestamp}.json"
+            filename = f"audit_results_{timestamp}.{'jsonl' if jsonl else 'json'}"
         
         # Save file in the audit_results folder
         filepath = os.path.join(audit_results_dir, filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+            with open(filepath, 'wb') as f:
+                if jsonl:
+                    for operation, result in results.items():
+                        line = {'operation': operation, 'result': result}
+                        f.write(orjson.dumps(line, option=self._RESULTS_JSON_OPTIONS, default=str) + b'\n')
+                else:
+                    f.write(orjson.dumps(results, option=self._RESULTS_JSON_OPTIONS | orjson.OPT_INDENT_2, default=str))
             logger.info(f"Audit results saved to {filepath}")
             print(f"\nResults saved to: {filepath}")
+            return filepath
         except Exception as e:
             logger.error(f"Error saving audit results: {e}")
+            return None
     
     # Removed display_structured_results as per requirements
     
@@ -1388,13 +2295,13 @@ class DataAuditTools:
         result = {}
         
         if self.active_tools is not None:
+            product_col = self.get_product_name_column()
             result['active_tools'] = {
                 'columns': list(self.active_tools.columns),
-                'product_name_column': self.get_product_name_column()
+                'product_name_column': product_col
             }
             
             # Include sample data from the product name column
-            product_col = self.get_product_name_column()
             if product_col in self.active_tools.columns:
                 result['active_tools']['sample_names'] = self.active_tools[product_col].dropna().head(3).tolist()
             else:
@@ -1411,8 +2318,6 @@ class DataAuditTools:
         """
         Return information about saved audit results as a dictionary
         """
-        import glob
-        
         result = {}
         
         # Find all audit result files in the audit_results folder
@@ -1422,7 +2327,13 @@ class DataAuditTools:
             result['message'] = "audit_results directory not found."
             return result
             
-        audit_files = glob.glob(os.path.join(audit_results_dir, "audit_results_*.json"))
+        # One scandir pass; each entry's stat() is fetched once and reused for the sort and the sizes
+        with os.scandir(audit_results_dir) as entries:
+            audit_files = [
+                (entry.path, entry.stat())
+                for entry in entries
+                if entry.name.startswith('audit_results_') and entry.name.endswith(('.json', '.jsonl')) and entry.is_file()
+            ]
         
         if not audit_files:
             result['status'] = 'no_files'
@@ -1430,16 +2341,15 @@ class DataAuditTools:
             return result
         
         # Sort files by modification time (newest first)
-        audit_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+        audit_files.sort(key=lambda item: item[1].st_mtime, reverse=True)
         
         # Prepare file info
         file_info = []
-        for filename in audit_files:
-            file_time = datetime.fromtimestamp(os.path.getmtime(filename))
-            file_size = os.path.getsize(filename)
+        for filename, stat in audit_files:
+            file_time = datetime.fromtimestamp(stat.st_mtime)
             file_info.append({
                 'filename': filename,
-                'size_bytes': file_size,
+                'size_bytes': stat.st_size,
                 'timestamp': file_time.isoformat(),
                 'formatted_time': file_time.strftime('%Y-%m-%d %H:%M:%S')
             })
@@ -1486,11 +2396,13 @@ class DataAuditTools:
             "11": "Exit"
         }
     
-    def run_operation(self, choice_num: int) -> Dict[str, Any]:
+    def run_operation(self, choice_num: int, use_local: bool = True, use_llm: bool = True) -> Dict[str, Any]:
         """Run a specific audit operation based on the choice number
         
         Args:
             choice_num: The menu choice number (1-11)
+            use_local: Run the local keyword scan of the accidental removal check (operations 6 and 7)
+            use_llm: Run the Gemini analysis of the accidental removal check (operations 6 and 7)
             
         Returns:
             Dictionary with operation results
@@ -1554,7 +2466,7 @@ class DataAuditTools:
                 
             elif choice_num == 6:
                 operation_name = 'Check for Accidental Removals'
-                data = self.check_accidental_removals()
+                data = self.check_accidental_removals(use_local=use_local, use_llm=use_llm)
                 
                 # Ensure tool names and ID tags are included
                 if 'accidental_removals' in data:
@@ -1564,7 +2476,7 @@ class DataAuditTools:
                 
             elif choice_num == 7:
                 operation_name = 'Complete Audit'
-                data = self.complete_audit()
+                data = self.complete_audit(use_local=use_local, use_llm=use_llm)
                 # This should already include all necessary IDs from the individual operations
                 
             elif choice_num == 8:
@@ -1603,11 +2515,13 @@ class DataAuditTools:
         
         return result
         
-    def run_menu(self, choices: List[str]) -> Dict[str, Any]:
+    def run_menu(self, choices: List[str], use_local: bool = True, use_llm: bool = True) -> Dict[str, Any]:
         """Run selected operations and return results
         
         Args:
             choices: List of menu choice numbers as strings
+            use_local: Passed through to run_operation
+            use_llm: Passed through to run_operation
             
         Returns:
             Dictionary with all operation results
@@ -1624,36 +2538,54 @@ class DataAuditTools:
             }
         }
         
-        for choice in choices:
-            try:
-                choice_num = int(choice)
-                
-                if choice_num == 11:  # Exit
-                    break
+        # Each finished operation is appended to a checkpoint file right away, so a crash
+        # part-way through a long audit keeps the results (and Gemini calls) already done
+        audit_results_dir = "audit_results"
+        os.makedirs(audit_results_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        checkpoint_path = os.path.join(audit_results_dir, f".checkpoint_{timestamp}.jsonl")
+        
+        with open(checkpoint_path, 'wb') as checkpoint:
+            def record_result(key, result):
+                audit_results['results'][key] = result
+                line = {'operation': key, 'result': result}
+                checkpoint.write(orjson.dumps(line, option=self._RESULTS_JSON_OPTIONS, default=str) + b'\n')
+                checkpoint.flush()
+                os.fsync(checkpoint.fileno())
+            
+            for choice in choices:
+                try:
+                    choice_num = int(choice)
                     
-                result = self.run_operation(choice_num)
-                audit_results['results'][f'operation_{choice_num}'] = result
-                
-                if result['status'] == 'completed':
-                    audit_results['summary']['operations_completed'] += 1
-                else:
-                    audit_results['summary']['operations_failed'] += 1
+                    if choice_num == 11:  # Exit
+                        break
+                        
+                    result = self.run_operation(choice_num, use_local=use_local, use_llm=use_llm)
+                    record_result(f'operation_{choice_num}', result)
                     
-            except ValueError:
-                logger.error(f"Invalid choice format: {choice}")
-                audit_results['results'][f'operation_{choice}'] = {
-                    'operation': f'Unknown operation ({choice})',
-                            'status': 'failed',
-                            'timestamp': datetime.now().isoformat(),
-                    'error': 'Invalid choice format'
-                        }
-                audit_results['summary']['operations_failed'] += 1
-                
-                # Always save results automatically
-                if audit_results['results']:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"audit_results_{timestamp}.json"
-                    self.save_audit_results(audit_results, filename)
+                    if result['status'] == 'completed':
+                        audit_results['summary']['operations_completed'] += 1
+                    else:
+                        audit_results['summary']['operations_failed'] += 1
+                        
+                except ValueError:
+                    logger.error(f"Invalid choice format: {choice}")
+                    record_result(f'operation_{choice}', {
+                        'operation': f'Unknown operation ({choice})',
+                        'status': 'failed',
+                        'timestamp': datetime.now().isoformat(),
+                        'error': 'Invalid choice format'
+                    })
+                    audit_results['summary']['operations_failed'] += 1
+        
+        # Always save results automatically; the checkpoint is only needed until they are
+        saved = None
+        if audit_results['results']:
+            saved = self.save_audit_results(audit_results, f"audit_results_{timestamp}.json")
+        if saved or not audit_results['results']:
+            os.remove(checkpoint_path)
+        else:
+            logger.warning(f"Partial results kept in {checkpoint_path}")
         
         return audit_results
     
@@ -1666,18 +2598,16 @@ class DataAuditTools:
         results = {}
         
         if self.active_tools is not None:
-            tools_to_remove = []
-            
             # Use Gemini for focused analysis in batches
             total_tools = len(self.active_tools)
             batch_size = 15
+            total_batches = (total_tools + batch_size - 1) // batch_size
+            # Resolved once for all batches rather than per batch inside the workers
+            product_name_column = self.get_product_name_column()
             
-            # Process tools in batches
-            for start_idx in range(0, total_tools, batch_size):
-                end_idx = min(start_idx + batch_size, total_tools)
-                batch_tools = self.active_tools.iloc[start_idx:end_idx]
-                batch_number = (start_idx // batch_size) + 1
-                total_batches = (total_tools + batch_size - 1) // batch_size
+            def process_batch(batch):
+                batch_number, start_idx, end_idx, batch_tools = batch
+                batch_removals = []
                 
                 # Processing batch for removal search
                 
@@ -1685,7 +2615,7 @@ class DataAuditTools:
                 Analyze these accessibility tools and identify ONLY the ones that must be removed.
                 
                 Batch {batch_number} of {total_batches} - Tools {start_idx+1} to {end_idx}:
-                {batch_tools.to_dict('records')}
+                {self._serialize_batch(batch_tools)}
                 
                 For each tool that should be removed, provide ONLY:
                 1. Tool name
@@ -1696,12 +2626,18 @@ class DataAuditTools:
                 """
                 
                 try:
-                    response = self.model.models.generate_content(model="gemini-2.0-flash", contents=prompt)
-                    
                     # Parse the response to extract only tool names and reasons
-                    analysis_text = response.text.strip()
+                    analysis_text = self._generate_cached(prompt).strip()
                     
                     if "No tools need removal" not in analysis_text:
+                        # Lower-case the batch's names once; an exact name is a set lookup and only
+                        # a miss falls back to the substring scan
+                        names_lower = [
+                            '' if pd.isna(name) else str(name).lower()
+                            for name in self._column_values(batch_tools, product_name_column, '')
+                        ]
+                        names_lower_set = set(names_lower)
+                        
                         # Extract tool names and reasons from the response
                         lines = analysis_text.split('\n')
                         for line in lines:
@@ -1715,27 +2651,25 @@ class DataAuditTools:
                                         reason = parts[1].strip()
                                         
                                         # Find the corresponding row in the data
-                                        for idx, row in batch_tools.iterrows():
-                                            if tool_name.lower() in str(row.get(self.get_product_name_column(), '')).lower():
-                                                tools_to_remove.append({
-                                                    'tool_name': tool_name,
-                                                    'reason': reason
-                                                })
-                                                break
-                    
-                    batch_result = {
-                        'batch': batch_number,
-                        'tools_range': f"{start_idx+1}-{end_idx}",
-                        'analysis': analysis_text
-                    }
+                                        tool_name_lower = tool_name.lower()
+                                        if tool_name_lower in names_lower_set or any(tool_name_lower in name for name in names_lower):
+                                            batch_removals.append({
+                                                'tool_name': tool_name,
+                                                'reason': reason
+                                            })
                     
                 except Exception as e:
                     logger.error(f"Error getting Gemini analysis for batch {batch_number}: {e}")
-                    batch_result = {
-                        'batch': batch_number,
-                        'tools_range': f"{start_idx+1}-{end_idx}",
-                        'analysis': f"Failed to get AI analysis: {e}"
-                    }
+                
+                return batch_removals
+            
+            # Search several batches at a time, collecting each batch's removals in batch order as it arrives
+            tools_to_remove = []
+            prompt_view = self._prompt_view(self.active_tools, self._REMOVAL_PROMPT_COLUMNS)
+            batch_stream = self._iter_concurrently(process_batch, self._iter_batches(prompt_view, batch_size))
+            for batch_number, batch_removals in enumerate(batch_stream, 1):
+                tools_to_remove.extend(batch_removals)
+                logger.info(f"Removal search: {batch_number}/{total_batches} batches done, {len(tools_to_remove)} tools flagged so far")
             
             results['tools_to_remove'] = tools_to_remove
             results['total_tools_analyzed'] = total_tools
@@ -1755,17 +2689,32 @@ def main():
             print("2. Set environment variable: $env:GOOGLE_GEMINI_API_KEY='your_api_key'")
             return
         
+        # --no-cache forces fresh Gemini responses for this run
+        # --local-only / --llm-only restrict the accidental removal check to one of its two passes
+        import sys
+        flags = {'--no-cache', '--local-only', '--llm-only'}
+        args = [arg for arg in sys.argv[1:] if arg not in flags]
+        use_cache = '--no-cache' not in sys.argv[1:]
+        use_local = '--llm-only' not in sys.argv[1:]
+        use_llm = '--local-only' not in sys.argv[1:]
+        if not use_local and not use_llm:
+            print("ERROR: --local-only and --llm-only cannot be used together")
+            return
+        
         # Initialize the audit tools
-        audit_tools = DataAuditTools(api_key)
+        audit_tools = DataAuditTools(api_key, cache_dir='.gemini_cache' if use_cache else None)
         
         # Always display the menu for reference
         audit_tools.display_menu()
         
         # Get command line arguments if provided
-        import sys
-        if len(sys.argv) > 1:
-            choices = sys.argv[1].split(',')
-            results = audit_tools.run_menu(choices)
+        if args:
+            choices = args[0].split(',')
+            if not (use_local and use_llm):
+                ignored = [choice.strip() for choice in choices if choice.strip() not in ('6', '7')]
+                if ignored:
+                    print(f"WARNING: --local-only / --llm-only only affect operations 6 and 7; ignored for: {', '.join(ignored)}")
+            results = audit_tools.run_menu(choices, use_local=use_local, use_llm=use_llm)
             # Operations completed, confirmation will be shown by save_audit_results
         # If no arguments provided, just show the menu and exit
         # No default operation is run
@@ -1,28 +1,111 @@
 import pandas as pd
+import numpy as np
 from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 import os
+import gzip
+import hashlib
+import logging
+import json
+import pickle
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Opt-in: write the output CSVs with pyarrow's multithreaded C++ writer instead of pandas
+ENABLE_ARROW = pa is not None and os.getenv('ENABLE_ARROW', '').lower() in ('1', 'true', 'yes')
+
 # If modifying these scopes, delete the file token.json.
-SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+# Drive metadata access is only used to read the spreadsheet version for the sheet cache.
+SCOPES = ['https://www.googleapis.com/auth/spreadsheets',
+          'https://www.googleapis.com/auth/drive.metadata.readonly']
+
+# Downloaded sheet data, one gzipped JSON file per spreadsheet version
+SHEET_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ai_data_audit')
+# Bump when the layout of the cached sheet data changes
+SHEET_CACHE_FORMAT = 1
+
+# Credentials already loaded by this process, keyed by their scopes
+_CREDS_CACHE = {}
+
+# Tokens expiring sooner than this are refreshed up front rather than mid-run
+TOKEN_REFRESH_WINDOW = timedelta(minutes=5)
+
+# Header row of the audited range, read first to locate the DESCRIPTION column
+HEADER_RANGE = 'A1:AH1'
+
+# Only the strikethrough flag of each DESCRIPTION cell is needed from the grid data
+FORMAT_FIELDS = 'sheets.data.rowData.values.userEnteredFormat.textFormat.strikethrough'
+
+def column_letter(col_idx):
+    """
+    Convert a zero-based column index to its A1 column letter (0 -> A, 26 -> AA)
+    """
+    letters = ''
+    col_idx += 1
+    while col_idx:
+        col_idx, remainder = divmod(col_idx - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+def token_is_fresh(creds):
+    """
+    Check that the credentials are valid and will stay valid for the refresh window
+    """
+    if not creds.valid:
+        return False
+    if creds.expiry is None:
+        return True
+    # google-auth stores expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - now > TOKEN_REFRESH_WINDOW
 
 def authenticate_google_sheets():
     """
     Authenticate with Google Sheets API
     """
-    creds = None
+    cache_key = tuple(SCOPES)
+    creds = _CREDS_CACHE.get(cache_key)
+    if creds and token_is_fresh(creds):
+        return creds
+    
+    saved_token = None
+    pickled = False
+    # token.pkl holds the credentials object saved by the last run, skipping the JSON parse
+    if creds is None and os.path.exists('token.pkl'):
+        try:
+            with open('token.pkl', 'rb') as token:
+                creds = pickle.load(token)
+            # A pickle saved under different scopes is stale; fall back to token.json
+            pickled = isinstance(creds, Credentials) and set(creds.scopes or []) == set(SCOPES)
+        except Exception as e:
+            print(f"Could not load token.pkl: {e}")
+        if not pickled:
+            creds = None
+    
     # The file token.json stores the user's access and refresh tokens.
-    if os.path.exists('token.json'):
-        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+    if creds is None and os.path.exists('token.json'):
+        with open('token.json') as token:
+            saved_token = token.read()
+        creds = Credentials.from_authorized_user_info(json.loads(saved_token), SCOPES)
     
-    # If there are no (valid) credentials available, let the user log in.
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
+    # If there are no (fresh) credentials available, refresh them or let the user log in.
+    if not creds or not token_is_fresh(creds):
+        if creds and creds.refresh_token:
             try:
                 creds.refresh(Request())
             except Exception as e:
@@ -47,12 +130,143 @@ def authenticate_google_sheets():
                 print("5. Download as credentials.json")
                 return None
         
-        # Save the credentials for the next run
-        with open('token.json', 'w') as token:
-            token.write(creds.to_json())
+        # Save the credentials for the next run, skipping the write if nothing changed
+        token_json = creds.to_json()
+        if token_json != saved_token:
+            with open('token.json', 'w') as token:
+                token.write(token_json)
+        pickled = False
     
+    # Keep token.pkl in step with token.json, which stays the interoperable copy
+    if not pickled:
+        with open('token.pkl', 'wb') as token:
+            pickle.dump(creds, token, protocol=5)
+    
+    _CREDS_CACHE[cache_key] = creds
     return creds
 
+class OrjsonModel(JsonModel):
+    """
+    JsonModel that parses responses with orjson, which is several times faster
+    than the json module on large value grids
+    """
+    
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Let the default model handle non-JSON bodies
+            return super().deserialize(content)
+        if self._data_wrapper and 'data' in body:
+            body = body['data']
+        return body
+
+def build_sheets_service(creds):
+    """
+    Build a Sheets API client. The underlying httplib2 connection is not thread-safe,
+    so every thread that makes requests needs its own client.
+    """
+    return build('sheets', 'v4', credentials=creds, cache_discovery=False, model=OrjsonModel())
+
+def get_sheet_version(creds, spreadsheet_id):
+    """
+    Get the Drive version of the spreadsheet, which increases on every edit, formatting included.
+    Returns None if it cannot be read, e.g. with a token granted before the Drive scope was added.
+    """
+    try:
+        drive = build('drive', 'v3', credentials=creds, cache_discovery=False, model=OrjsonModel())
+        return drive.files().get(fileId=spreadsheet_id, fields='version').execute().get('version')
+    except Exception as e:
+        print(f"Could not read the spreadsheet version, not using the sheet cache: {e}")
+        return None
+
+def sheet_cache_path(spreadsheet_id, version, range_name):
+    """
+    Path of the cached sheet data for one version of the spreadsheet. The name also hashes
+    the ranges, fields mask and cache format, so data fetched differently is never reused.
+    """
+    fetch_key = f"{SHEET_CACHE_FORMAT}\n{HEADER_RANGE}\n{range_name}\n{FORMAT_FIELDS}"
+    fetch_hash = hashlib.sha256(fetch_key.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(SHEET_CACHE_DIR, f'{spreadsheet_id}-{version}-{fetch_hash}.json.gz')
+
+def load_cached_sheet(spreadsheet_id, version, range_name):
+    """
+    Load the cached sheet data for this version of the spreadsheet, or None on a miss
+    """
+    try:
+        with gzip.open(sheet_cache_path(spreadsheet_id, version, range_name), 'rb') as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Ignoring unreadable sheet cache: {e}")
+        return None
+
+def save_cached_sheet(spreadsheet_id, version, range_name, sheet_data):
+    """
+    Cache the sheet data for this version, replacing older entries for the spreadsheet
+    """
+    try:
+        os.makedirs(SHEET_CACHE_DIR, exist_ok=True)
+        for entry in os.scandir(SHEET_CACHE_DIR):
+            if entry.name.startswith(f'{spreadsheet_id}-'):
+                os.remove(entry.path)
+        with gzip.open(sheet_cache_path(spreadsheet_id, version, range_name), 'wb') as f:
+            f.write(orjson.dumps(sheet_data))
+    except OSError as e:
+        print(f"Could not write the sheet cache: {e}")
+
+def fetch_sheet_data(creds, spreadsheet_id, range_name):
+    """
+    Fetch the sheet values and the grid data of the DESCRIPTION column.
+    Returns a dict with 'values' and 'row_data', or None if either is missing.
+    """
+    sheet = build_sheets_service(creds).spreadsheets()
+    
+    # Read the header row first so the formatting fetch can be limited to DESCRIPTION
+    header_result = sheet.values().get(spreadsheetId=spreadsheet_id, range=HEADER_RANGE).execute()
+    header_values = header_result.get('values', [])
+    headers = header_values[0] if header_values else []
+    
+    if 'DESCRIPTION' not in headers:
+        print("DESCRIPTION column not found!")
+        return None
+    
+    description_col_idx = headers.index('DESCRIPTION')
+    print(f"DESCRIPTION column found at index: {description_col_idx}")
+    
+    # Get the strikethrough flags of the DESCRIPTION column only
+    description_col = column_letter(description_col_idx)
+    
+    def fetch_format():
+        return build_sheets_service(creds).spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            includeGridData=True,
+            ranges=[f'{description_col}:{description_col}'],
+            fields=FORMAT_FIELDS).execute()
+    
+    # The values and formatting requests are independent, so run them concurrently
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        format_future = executor.submit(fetch_format)
+        # batchGet lets further ranges (e.g. other tabs) share this one request
+        result = sheet.values().batchGet(spreadsheetId=spreadsheet_id, ranges=[range_name]).execute()
+        value_ranges = result.get('valueRanges', [])
+        values = [headers] + (value_ranges[0].get('values', []) if value_ranges else [])
+        result_format = format_future.result()
+    
+    # Extract formatting data
+    sheets_data = result_format.get('sheets', [])
+    if not sheets_data:
+        print("No sheet data found")
+        return None
+        
+    grid_data = sheets_data[0].get('data', [])
+    if not grid_data:
+        print("No grid data found")
+        return None
+    
+    return {'values': values, 'row_data': grid_data[0].get('rowData', [])}
+
 def detect_strikethrough_tools():
     """
     Detect tools with strikethrough formatting using Google Sheets API
@@ -62,42 +276,27 @@ def detect_strikethrough_tools():
     if not creds:
         return None, None
     
-    service = build('sheets', 'v4', credentials=creds)
-    
     # Spreadsheet details
     SPREADSHEET_ID = os.getenv('SPREADSHEET_ID')
-    RANGE_NAME = 'A:AH'  # Use range without sheet name
+    RANGE_NAME = 'A2:AH'  # Rows below the header; use range without sheet name
     
     try:
-        # Get the spreadsheet data with formatting
-        sheet = service.spreadsheets()
-        
-        # Get values
-        result = sheet.values().get(spreadsheetId=SPREADSHEET_ID, range=RANGE_NAME).execute()
-        values = result.get('values', [])
-        
-        # Get formatting information
-        result_format = sheet.get(spreadsheetId=SPREADSHEET_ID, 
-                                includeGridData=True,
-                                ranges=[RANGE_NAME]).execute()
-        
-        # Extract formatting data
-        sheets_data = result_format.get('sheets', [])
-        if not sheets_data:
-            print("No sheet data found")
-            return None, None
-            
-        grid_data = sheets_data[0].get('data', [])
-        if not grid_data:
-            print("No grid data found")
-            return None, None
-        
-        row_data = grid_data[0].get('rowData', [])
+        # Reuse the cached download while the spreadsheet version is unchanged
+        version = get_sheet_version(creds, SPREADSHEET_ID)
+        sheet_data = load_cached_sheet(SPREADSHEET_ID, version, RANGE_NAME) if version else None
+        if sheet_data is not None:
+            print(f"Using cached sheet data (version {version})")
+        else:
+            sheet_data = fetch_sheet_data(creds, SPREADSHEET_ID, RANGE_NAME)
+            if sheet_data is None:
+                return None, None
+            if version:
+                save_cached_sheet(SPREADSHEET_ID, version, RANGE_NAME, sheet_data)
         
-        # Create DataFrame from values
-        df = pd.DataFrame(values[1:], columns=values[0] if values else [])
+        values = sheet_data['values']
+        row_data = sheet_data['row_data']
         
-        # Drop unwanted columns
+        # Drop unwanted columns from the raw rows, before the DataFrame is built
         columns_to_drop = [
             'ENTERED BY', 
             'AUDITED BY',
@@ -105,47 +304,50 @@ def detect_strikethrough_tools():
             'Unnamed: 35'
         ]
         
-        existing_columns_to_drop = [col for col in columns_to_drop if col in df.columns]
+        columns = values[0] if values else []
+        existing_columns_to_drop = [col for col in columns_to_drop if col in columns]
         if existing_columns_to_drop:
-            df = df.drop(columns=existing_columns_to_drop)
             print(f"Dropped columns: {existing_columns_to_drop}")
         
-        # Find the DESCRIPTION column index
-        description_col_idx = None
-        if len(values) > 0:
-            headers = values[0]
-            for idx, header in enumerate(headers):
-                if header == 'DESCRIPTION':
-                    description_col_idx = idx
-                    break
-        
-        if description_col_idx is None:
-            print("DESCRIPTION column not found!")
-            return None, None
-        
-        print(f"DESCRIPTION column found at index: {description_col_idx}")
-        
-        # Find strikethrough rows by checking only the DESCRIPTION column
-        strikethrough_rows = []
-        
-        for row_idx, row in enumerate(row_data[1:], 1):  # Skip header row
-            if 'values' in row and len(row['values']) > description_col_idx:
-                # Check only the DESCRIPTION column (at description_col_idx)
-                desc_cell = row['values'][description_col_idx]
-                
-                if 'userEnteredFormat' in desc_cell:
-                    text_format = desc_cell['userEnteredFormat'].get('textFormat', {})
-                    if text_format.get('strikethrough', False):
-                        strikethrough_rows.append(row_idx - 1)  # Adjust for DataFrame indexing
-                        print(f"Row {row_idx - 1}: DESCRIPTION has strikethrough - marking entire row as removed")
+        # Create DataFrame from the kept columns; short rows are padded with None
+        keep_idx = [idx for idx, col in enumerate(columns) if col not in columns_to_drop]
+        rows = [[row[idx] if idx < len(row) else None for idx in keep_idx] for row in values[1:]]
+        df = pd.DataFrame(rows, columns=[columns[idx] for idx in keep_idx])
+        
+        # Read the DESCRIPTION strikethrough flag of every data row in one pass;
+        # the formatting range holds only the DESCRIPTION column
+        flag_rows = row_data[1:len(values)]  # Skip header row
+        
+        # The fields mask leaves out unset formats, so with no formatted DESCRIPTION cell
+        # there is nothing to scan or split
+        if not any('userEnteredFormat' in row['values'][0] for row in flag_rows if row.get('values')):
+            print("No strikethrough formatting found")
+            return df, pd.DataFrame()
+        
+        strike_flags = np.fromiter(
+            (bool(row['values'][0].get('userEnteredFormat', {}).get('textFormat', {}).get('strikethrough', False))
+             if row.get('values') else False
+             for row in flag_rows),
+            dtype=bool, count=len(flag_rows))
+        
+        # Rows missing from the grid data have no formatting
+        removed_mask = np.zeros(len(df), dtype=bool)
+        removed_mask[:len(strike_flags)] = strike_flags
+        strikethrough_rows = np.flatnonzero(removed_mask)
+        
+        # Per-row detail goes to the debug log; the summary below is always printed
+        if logger.isEnabledFor(logging.DEBUG):
+            for row_idx in strikethrough_rows:
+                logger.debug("Row %d: DESCRIPTION has strikethrough - marking entire row as removed", row_idx)
         
         print(f"Found {len(strikethrough_rows)} rows with strikethrough formatting")
-        print(f"Strikethrough row indices: {strikethrough_rows[:10]}...")  # Show first 10
+        print(f"Strikethrough row indices: {strikethrough_rows[:10].tolist()}...")  # Show first 10
         
         # Split the data
-        if strikethrough_rows:
-            removed_tools = df.iloc[strikethrough_rows].copy()
-            active_tools = df.drop(index=strikethrough_rows).copy()
+        if len(strikethrough_rows):
+            # Split with one boolean mask; boolean indexing already returns new frames
+            removed_tools = df[removed_mask]
+            active_tools = df[~removed_mask]
             
             print(f"Active tools: {len(active_tools)} rows")
             print(f"Removed tools: {len(removed_tools)} rows")
@@ -160,20 +362,39 @@ def detect_strikethrough_tools():
         return None, None
 
 
+def write_csv(df, path):
+    """
+    Write a DataFrame to CSV without its index, using pyarrow when ENABLE_ARROW is set
+    """
+    if ENABLE_ARROW:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pacsv.write_csv(table, path, write_options=pacsv.WriteOptions(quoting_style='needed'))
+    else:
+        df.to_csv(path, index=False)
 
 def main():
     """
     Main function to detect and separate strikethrough tools
     """
+    # LOG_LEVEL=DEBUG also shows each struck-through row
+    log_level = getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), None)
+    logging.basicConfig(level=log_level if isinstance(log_level, int) else logging.INFO,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    
     print("Attempting to detect strikethrough formatting...")
     
     active_tools, removed_tools = detect_strikethrough_tools()
     
     if active_tools is not None:
-        # Save the separated data
-        active_tools.to_csv('active_tools.csv', index=False)
+        # Save the separated data; the two files are independent, so write them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(write_csv, active_tools, 'active_tools.csv')]
+            if len(removed_tools) > 0:
+                futures.append(executor.submit(write_csv, removed_tools, 'removed_tools.csv'))
+            for future in futures:
+                future.result()
+        
         if len(removed_tools) > 0:
-            removed_tools.to_csv('removed_tools.csv', index=False)
             print(f"Saved {len(removed_tools)} removed tools to 'removed_tools.csv'")
         
         print(f"Saved {len(active_tools)} active tools to 'active_tools.csv'")
@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+import data_audit_tools
+
+
+def _reject_constant(token):
+    raise ValueError(f"{token} is not valid JSON")
+
+
+class _FakeModels:
+    """Records prompts and answers every request with an empty suggestion list"""
+    
+    def __init__(self):
+        self.prompts = []
+    
+    def generate_content_stream(self, model=None, contents=None, config=None):
+        self.prompts.append(contents)
+        return [mock.Mock(text='[]')]
+
+
+class MissingValuesPromptTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.addCleanup(self._tmp.cleanup)
+        self.addCleanup(os.chdir, self._cwd)
+    
+    def test_blank_tool_name_is_serialized_as_null(self):
+        pd.DataFrame({
+            'ID TAG': ['T1', 'T2'],
+            'PRODUCT/FEATURE\nNAME': ['Read Aloud', None],
+            'DESCRIPTION': ['Reads pages aloud', None],
+        }).to_csv('active_tools.csv', index=False)
+        
+        models = _FakeModels()
+        with mock.patch.object(data_audit_tools, '_client', return_value=mock.Mock(models=models)):
+            audit_tools = data_audit_tools.DataAuditTools('test-key', cache_dir=None)
+            audit_tools.analyze_missing_values()
+        
+        self.assertTrue(models.prompts)
+        for prompt in models.prompts:
+            # parse_constant rejects NaN/Infinity, which json.loads would otherwise accept
+            payload = json.loads(prompt.split('Tools with missing requirements:\n', 1)[1], parse_constant=_reject_constant)
+            self.assertIn(None, [tool['tool_name'] for tool in payload])
+
+
+if __name__ == '__main__':
+    unittest.main()